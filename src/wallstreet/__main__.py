@@ -4,11 +4,6 @@ import argparse
 import random
 import sys
 
-from wallstreet.cli.app import run_game
-from wallstreet.cli.display import display_game_list
-from wallstreet.models.game import GameConfig
-from wallstreet.persistence.repository import GameRepository
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -34,6 +29,13 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Imported after parsing so --help and usage errors skip loading
+    # NumPy, Pydantic and the game engine
+    from wallstreet.cli.app import run_game
+    from wallstreet.cli.display import display_game_list
+    from wallstreet.models.game import GameConfig
+    from wallstreet.persistence.repository import GameRepository
+
     if args.list_games:
         repo = GameRepository()
         repo.initialize()
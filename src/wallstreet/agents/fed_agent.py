@@ -2,6 +2,7 @@
 
 import random
 
+from wallstreet.agents.rand_batch import RandBatch
 from wallstreet.models.enums import RateDirection, Regime, VolatilityState
 from wallstreet.models.market import MacroState
 from wallstreet.models.narrative import FedStatement
@@ -118,7 +119,7 @@ class FedChairAgent:
     generate() method can be swapped to an LLM call later.
     """
 
-    def generate(self, macro: MacroState, rng: random.Random) -> FedStatement:
+    def generate(self, macro: MacroState, rng: random.Random | RandBatch) -> FedStatement:
         """Generate a Fed policy statement for the current week."""
         key = (macro.regime, macro.rate_direction)
         templates = _STATEMENT_TEMPLATES[key]
@@ -2,6 +2,7 @@
 
 import random
 
+from wallstreet.agents.rand_batch import RandBatch
 from wallstreet.models.enums import RateDirection, Regime, Sector, VolatilityState
 from wallstreet.models.events import ShockEvent
 from wallstreet.models.market import MacroState
@@ -251,7 +252,7 @@ _EVENT_HEADLINES: dict[str, list[tuple[str, str, dict[str, str]]]] = {
 def generate_headlines(
     macro: MacroState,
     events: list[ShockEvent],
-    rng: random.Random,
+    rng: random.Random | RandBatch,
 ) -> list[Headline]:
     """Generate 2-4 weekly headlines from market conditions and events.
 
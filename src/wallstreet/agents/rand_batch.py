@@ -0,0 +1,45 @@
+"""RandBatch — a pre-drawn block of uniforms shared by the narrative agents."""
+
+import random
+from collections.abc import Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class RandBatch:
+    """Serve the small random draws the narrative agents need from one batch.
+
+    Draws ``size`` floats from the source RNG up front and hands them out
+    in order through the subset of the random.Random API the agents use
+    (random, choice, uniform, randint). If a week needs more draws than
+    the batch holds, another batch of the same size is drawn, so results
+    stay reproducible for a given seed.
+    """
+
+    def __init__(self, rng: random.Random, size: int) -> None:
+        self._rng = rng
+        self._size = size
+        self._floats = [rng.random() for _ in range(size)]
+        self._pos = 0
+
+    def random(self) -> float:
+        """Next float in [0.0, 1.0)."""
+        if self._pos == self._size:
+            self._floats = [self._rng.random() for _ in range(self._size)]
+            self._pos = 0
+        value = self._floats[self._pos]
+        self._pos += 1
+        return value
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Pick one element of a non-empty sequence."""
+        return seq[int(self.random() * len(seq))]
+
+    def uniform(self, a: float, b: float) -> float:
+        """Float in [a, b], same formula as random.Random.uniform."""
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b] inclusive."""
+        return a + int(self.random() * (b - a + 1))
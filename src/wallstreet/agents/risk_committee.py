@@ -129,9 +129,7 @@ class RulesBasedRiskCommittee(RiskAgent):
             VolatilityState.HIGH,
             VolatilityState.CRISIS,
         ):
-            short_sectors = [
-                s.value for s, w in allocation.weights.items() if w < 0
-            ]
+            short_sectors = [s.value for s in allocation.short_sectors]
             risk_score += 1
             warnings.append(
                 f"Short positions ({', '.join(short_sectors)}) during high "
@@ -140,9 +138,7 @@ class RulesBasedRiskCommittee(RiskAgent):
 
         # Rule 9: Counter-trend short warning (shorting in bull market)
         if allocation.has_shorts and macro_state.regime == Regime.BULL:
-            short_sectors = [
-                s.value for s, w in allocation.weights.items() if w < 0
-            ]
+            short_sectors = [s.value for s in allocation.short_sectors]
             risk_score += 1
             warnings.append(
                 f"Shorting ({', '.join(short_sectors)}) in a bull market "
@@ -2,7 +2,9 @@
 
 import random
 
-from wallstreet.models.enums import Regime, Sector
+import numpy as np
+
+from wallstreet.models.enums import SECTOR_ORDER, Regime, Sector
 from wallstreet.models.game import GameState
 from wallstreet.models.market import MacroState
 from wallstreet.models.portfolio import Allocation
@@ -124,12 +126,11 @@ def _normalize_weights(raw: dict[Sector, float], min_pct: float = 5.0) -> dict[S
 
 def _trailing_returns(game_state: GameState, window: int = 4) -> dict[Sector, float]:
     """Compute trailing cumulative return per sector over the last `window` weeks."""
-    history = game_state.history[-window:] if game_state.history else []
-    cumulative: dict[Sector, float] = {s: 0.0 for s in Sector}
-    for week_result in history:
-        for sector in Sector:
-            cumulative[sector] += week_result.adjusted_returns.returns[sector]
-    return cumulative
+    history = game_state.history[-window:]
+    if not history:
+        return {s: 0.0 for s in SECTOR_ORDER}
+    cumulative = np.sum([wr.adjusted_returns.as_array for wr in history], axis=0)
+    return dict(zip(SECTOR_ORDER, cumulative.tolist()))
 
 
 class RivalPM:
@@ -157,7 +158,7 @@ class RivalPM:
         elif self.strategy_type == VALUE:
             weights = self._value_decide(game_state, rng)
         else:
-            weights = {s: 100.0 / len(Sector) for s in Sector}
+            weights = {s: 100.0 / len(SECTOR_ORDER) for s in SECTOR_ORDER}
 
         return Allocation(weights=weights)
 
@@ -170,14 +171,14 @@ class RivalPM:
         if not game_state.history or all(v == 0.0 for v in trailing.values()):
             # No history — equal weight with small noise
             return _normalize_weights(
-                {s: 20.0 + rng.uniform(-2, 2) for s in Sector}, min_pct=5.0
+                {s: 20.0 + rng.uniform(-2, 2) for s in SECTOR_ORDER}, min_pct=5.0
             )
 
         # Shift returns so they're all positive for weighting
         min_ret = min(trailing.values())
-        shifted = {s: trailing[s] - min_ret + 0.01 for s in Sector}
+        shifted = {s: trailing[s] - min_ret + 0.01 for s in SECTOR_ORDER}
         total = sum(shifted.values())
-        raw = {s: (shifted[s] / total) * 100.0 for s in Sector}
+        raw = {s: (shifted[s] / total) * 100.0 for s in SECTOR_ORDER}
         return _normalize_weights(raw, min_pct=5.0)
 
     def _defensive_decide(
@@ -186,7 +187,7 @@ class RivalPM:
         """Defensive: prioritize low-vol sectors, heavy Consumer."""
         base = dict(_DEFENSIVE_TARGETS[macro.regime])
         # Add slight randomness
-        for s in Sector:
+        for s in SECTOR_ORDER:
             base[s] += rng.uniform(-3, 3)
         return _normalize_weights(base, min_pct=5.0)
 
@@ -196,7 +197,7 @@ class RivalPM:
         """Macro Timer: read the regime and position accordingly."""
         base = dict(_MACRO_TIMER_TARGETS[macro.regime])
         # Add slight randomness
-        for s in Sector:
+        for s in SECTOR_ORDER:
             base[s] += rng.uniform(-3, 3)
         return _normalize_weights(base, min_pct=5.0)
 
@@ -209,12 +210,12 @@ class RivalPM:
         if not game_state.history or all(v == 0.0 for v in trailing.values()):
             # No history — equal weight with noise
             return _normalize_weights(
-                {s: 20.0 + rng.uniform(-2, 2) for s in Sector}, min_pct=10.0
+                {s: 20.0 + rng.uniform(-2, 2) for s in SECTOR_ORDER}, min_pct=10.0
             )
 
         # Invert returns: worst performers get highest weight
         max_ret = max(trailing.values())
-        inverted = {s: max_ret - trailing[s] + 0.01 for s in Sector}
+        inverted = {s: max_ret - trailing[s] + 0.01 for s in SECTOR_ORDER}
         total = sum(inverted.values())
-        raw = {s: (inverted[s] / total) * 100.0 for s in Sector}
+        raw = {s: (inverted[s] / total) * 100.0 for s in SECTOR_ORDER}
         return _normalize_weights(raw, min_pct=10.0)
@@ -2,14 +2,25 @@
 
 import random
 
-from wallstreet.models.enums import RateDirection, Regime, Sector, VolatilityState
+from wallstreet.agents.rand_batch import RandBatch
+from wallstreet.models.enums import (
+    SECTOR_ORDER,
+    RateDirection,
+    Regime,
+    Sector,
+)
 from wallstreet.models.game import GameState
 from wallstreet.models.market import MacroState
 from wallstreet.models.narrative import ShortThesis
 from wallstreet.models.portfolio import Allocation
 
-# Sectors classified as cyclical (sensitive to economic downturns)
-_CYCLICAL_SECTORS = {Sector.TECH, Sector.ENERGY, Sector.INDUSTRIALS, Sector.CONSUMER_DISC}
+# Sectors classified as cyclical (sensitive to economic downturns), in
+# SECTOR_ORDER so ties between them break the same way in every process
+_CYCLICAL_SECTORS = tuple(
+    s
+    for s in SECTOR_ORDER
+    if s in (Sector.TECH, Sector.ENERGY, Sector.INDUSTRIALS, Sector.CONSUMER_DISC)
+)
 
 # Rate-sensitive sectors
 _RATE_SENSITIVE = {Sector.TECH, Sector.FINANCIALS}
@@ -175,7 +186,7 @@ class ShortSellerAgent:
         allocation: Allocation,
         macro: MacroState,
         game_state: GameState,
-        rng: random.Random,
+        rng: random.Random | RandBatch,
     ) -> ShortThesis | None:
         """Analyze player allocation for vulnerabilities.
 
@@ -211,7 +222,7 @@ class ShortSellerAgent:
         return None
 
     def _check_concentration(
-        self, allocation: Allocation, rng: random.Random
+        self, allocation: Allocation, rng: random.Random | RandBatch
     ) -> ShortThesis | None:
         """Attack any sector with |weight| > 40%."""
         for sector, weight in allocation.weights.items():
@@ -228,7 +239,7 @@ class ShortSellerAgent:
         return None
 
     def _check_player_short(
-        self, allocation: Allocation, macro: MacroState, rng: random.Random
+        self, allocation: Allocation, macro: MacroState, rng: random.Random | RandBatch
     ) -> ShortThesis | None:
         """Attack player short positions in bull/recovery markets (squeeze risk)."""
         if macro.regime not in (Regime.BULL, Regime.RECOVERY):
@@ -253,7 +264,7 @@ class ShortSellerAgent:
         )
 
     def _check_regime_misalignment(
-        self, allocation: Allocation, macro: MacroState, rng: random.Random
+        self, allocation: Allocation, macro: MacroState, rng: random.Random | RandBatch
     ) -> ShortThesis | None:
         """Attack cyclicals that are overweight during recession/bear."""
         if macro.regime not in (Regime.RECESSION, Regime.BEAR):
@@ -280,7 +291,7 @@ class ShortSellerAgent:
         )
 
     def _check_rate_sensitivity(
-        self, allocation: Allocation, macro: MacroState, rng: random.Random
+        self, allocation: Allocation, macro: MacroState, rng: random.Random | RandBatch
     ) -> ShortThesis | None:
         """Attack tech overweight when rates are rising."""
         if macro.rate_direction != RateDirection.RISING:
@@ -300,14 +311,14 @@ class ShortSellerAgent:
         )
 
     def _check_momentum_reversal(
-        self, allocation: Allocation, game_state: GameState, rng: random.Random
+        self, allocation: Allocation, game_state: GameState, rng: random.Random | RandBatch
     ) -> ShortThesis | None:
         """Attack sectors with 2+ weeks of positive returns where player is heavy."""
         if len(game_state.history) < 2:
             return None
 
         recent = game_state.history[-2:]
-        for sector in Sector:
+        for sector in SECTOR_ORDER:
             # Check if sector had 2 consecutive positive weeks
             streak = all(
                 week.adjusted_returns.returns[sector] > 0.0 for week in recent
@@ -2,10 +2,38 @@
 
 import math
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from wallstreet.models.analytics import ExpandedMetrics
 from wallstreet.models.portfolio import Allocation
 
 
+def _rolling_mean_std(
+    returns: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing-window mean and sample std at every position of the last axis.
+
+    Windows are truncated at the start of the series, as in the list
+    functions below; a window of fewer than two returns gets std 0.0.
+    Full windows are evaluated all at once through a strided view.
+    """
+    n = returns.shape[-1]
+    means = returns.astype(np.float64, copy=True)
+    stds = np.zeros(returns.shape)
+    if window < 2:
+        return means, stds
+    for i in range(1, min(window - 1, n)):
+        head = returns[..., : i + 1]
+        means[..., i] = head.mean(axis=-1)
+        stds[..., i] = head.std(axis=-1, ddof=1)
+    if n >= window:
+        windows = sliding_window_view(returns, window, axis=-1)
+        means[..., window - 1 :] = windows.mean(axis=-1)
+        stds[..., window - 1 :] = windows.std(axis=-1, ddof=1)
+    return means, stds
+
+
 def compute_rolling_volatility(
     weekly_returns: list[float], window: int = 4
 ) -> list[float]:
@@ -16,19 +44,26 @@ def compute_rolling_volatility(
     if not weekly_returns:
         return []
 
-    result: list[float] = []
-    for i in range(len(weekly_returns)):
-        start = max(0, i - window + 1)
-        segment = weekly_returns[start : i + 1]
-        if len(segment) < 2:
-            result.append(0.0)
-            continue
-        mean = sum(segment) / len(segment)
-        variance = sum((r - mean) ** 2 for r in segment) / (len(segment) - 1)
-        weekly_vol = math.sqrt(variance)
-        annualized = weekly_vol * math.sqrt(12)
-        result.append(round(annualized, 6))
-    return result
+    _, stds = _rolling_mean_std(np.asarray(weekly_returns, dtype=np.float64), window)
+    stds *= math.sqrt(12)
+    return np.round(stds, 6, out=stds).tolist()
+
+
+def compute_rolling_sharpe_batch(
+    returns: np.ndarray, window: int = 4, risk_free: float = 0.0
+) -> np.ndarray:
+    """Rolling annualized Sharpe ratio for many return series at once.
+
+    returns is a (series, weeks) array, e.g. one row per simulated season;
+    each row gives the same values as compute_rolling_sharpe (unrounded).
+    """
+    means, stds = _rolling_mean_std(np.asarray(returns, dtype=np.float64), window)
+    valid = stds >= 1e-10
+    sharpe = np.subtract(means, risk_free)
+    np.divide(sharpe, stds, out=sharpe, where=valid)
+    sharpe[~valid] = 0.0
+    sharpe *= math.sqrt(12)
+    return sharpe
 
 
 def compute_rolling_sharpe(
@@ -41,23 +76,10 @@ def compute_rolling_sharpe(
     if not weekly_returns:
         return []
 
-    result: list[float] = []
-    for i in range(len(weekly_returns)):
-        start = max(0, i - window + 1)
-        segment = weekly_returns[start : i + 1]
-        if len(segment) < 2:
-            result.append(0.0)
-            continue
-        mean = sum(segment) / len(segment)
-        variance = sum((r - mean) ** 2 for r in segment) / (len(segment) - 1)
-        weekly_vol = math.sqrt(variance)
-        if weekly_vol < 1e-10:
-            result.append(0.0)
-            continue
-        weekly_sharpe = (mean - risk_free) / weekly_vol
-        annualized = weekly_sharpe * math.sqrt(12)
-        result.append(round(annualized, 6))
-    return result
+    sharpe = compute_rolling_sharpe_batch(
+        np.asarray(weekly_returns, dtype=np.float64), window, risk_free
+    )
+    return np.round(sharpe, 6, out=sharpe).tolist()
 
 
 def compute_drawdown_series(weekly_values: list[float]) -> list[float]:
@@ -69,16 +91,12 @@ def compute_drawdown_series(weekly_values: list[float]) -> list[float]:
     if not weekly_values:
         return []
 
-    result: list[float] = []
-    peak = weekly_values[0]
-    for value in weekly_values:
-        peak = max(peak, value)
-        if peak > 0:
-            dd = (value - peak) / peak
-        else:
-            dd = 0.0
-        result.append(round(dd, 6))
-    return result
+    values = np.asarray(weekly_values, dtype=np.float64)
+    peaks = np.maximum.accumulate(values)
+    drawdowns = np.subtract(values, peaks)
+    np.divide(drawdowns, peaks, out=drawdowns, where=peaks > 0)
+    drawdowns[peaks <= 0] = 0.0
+    return np.round(drawdowns, 6, out=drawdowns).tolist()
 
 
 def compute_concentration_score(allocation: Allocation) -> float:
@@ -87,12 +105,12 @@ def compute_concentration_score(allocation: Allocation) -> float:
     Uses absolute values normalized by gross exposure so HHI stays
     in the 0.20–1.0 range regardless of short positions.
     """
-    fractions = allocation.as_fractions
-    gross = sum(abs(f) for f in fractions.values())
+    gross = allocation.gross_exposure
     if gross < 1e-10:
         return 0.0
-    normalized = {s: abs(f) / gross for s, f in fractions.items()}
-    hhi = sum(f ** 2 for f in normalized.values())
+    # sum((|w| / gross)^2) == (w . w) / gross^2, on the cached fraction vector
+    vec = allocation.as_vector
+    hhi = float(vec @ vec) / (gross * gross)
     return round(hhi, 6)
 
 
@@ -19,6 +19,19 @@ def create_new_career(player_name: str) -> CareerProfile:
     )
 
 
+# (min seasons, then strict lower bounds on best_sharpe, lifetime_cagr and
+# worst_drawdown), best tier first. None leaves a stat unchecked, so a NaN
+# stat only fails the tiers that actually test it.
+_TITLE_TIERS: tuple[
+    tuple[int, float | None, float | None, float | None, CareerTitle], ...
+] = (
+    (10, 1.5, None, -0.25, CareerTitle.LEGENDARY_ALLOCATOR),
+    (5, 1.0, None, None, CareerTitle.INSTITUTIONAL_STRATEGIST),
+    (3, None, 0.0, None, CareerTitle.MACRO_OPERATOR),
+    (1, None, None, None, CareerTitle.JUNIOR_PM),
+)
+
+
 def compute_title(profile: CareerProfile) -> CareerTitle:
     """Compute the career title based on cumulative stats.
 
@@ -29,22 +42,18 @@ def compute_title(profile: CareerProfile) -> CareerTitle:
     - JUNIOR_PM: 1+ completed seasons
     - RETAIL_SPECULATOR: default
     """
-    if (
-        profile.seasons_played >= 10
-        and profile.best_sharpe > 1.5
-        and profile.worst_drawdown > -0.25
-    ):
-        return CareerTitle.LEGENDARY_ALLOCATOR
-
-    if profile.seasons_played >= 5 and profile.best_sharpe > 1.0:
-        return CareerTitle.INSTITUTIONAL_STRATEGIST
-
-    if profile.seasons_played >= 3 and profile.lifetime_cagr > 0:
-        return CareerTitle.MACRO_OPERATOR
-
-    if profile.seasons_played >= 1:
-        return CareerTitle.JUNIOR_PM
-
+    seasons = profile.seasons_played
+    sharpe = profile.best_sharpe
+    cagr = profile.lifetime_cagr
+    drawdown = profile.worst_drawdown
+    for min_seasons, min_sharpe, min_cagr, min_drawdown, title in _TITLE_TIERS:
+        if (
+            seasons >= min_seasons
+            and (min_sharpe is None or sharpe > min_sharpe)
+            and (min_cagr is None or cagr > min_cagr)
+            and (min_drawdown is None or drawdown > min_drawdown)
+        ):
+            return title
     return CareerTitle.RETAIL_SPECULATOR
 
 
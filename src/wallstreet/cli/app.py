@@ -34,14 +34,18 @@ from wallstreet.config import INITIAL_RATE_DIR, INITIAL_REGIME, INITIAL_VOL_STAT
 from wallstreet.event_engine.generator import generate_weekly_events
 from wallstreet.layers.competition import GameCompetitionLayer
 from wallstreet.layers.narrative import GameNarrativeLayer
+from wallstreet.market_engine.correlation import PrecomputedNoise
 from wallstreet.market_engine.regime import advance_macro_state
-from wallstreet.market_engine.returns import apply_events, generate_sector_returns
-from wallstreet.models.enums import Sector
+from wallstreet.market_engine.returns import (
+    apply_events_array,
+    generate_sector_returns_array,
+)
+from wallstreet.models.enums import SECTOR_ORDER, Sector
 from wallstreet.models.game import GameConfig, GameState, WeekResult
 from wallstreet.models.market import MacroState, SectorReturns
 from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
 from wallstreet.persistence.repository import GameRepository
-from wallstreet.scoring.calculator import compute_scorecard
+from wallstreet.scoring.calculator import compute_period_returns, compute_scorecard
 
 
 def run_game(
@@ -70,13 +74,15 @@ def run_game(
     _flush = flush_fn or (lambda: None)
 
     rng = random.Random(config.seed)
+    # Correlated return shocks for the whole season, drawn once up front
+    noise = PrecomputedNoise(config.seed, config.total_weeks)
     repo = GameRepository()
     repo.initialize()
     risk_agent = create_risk_agent("rules")
 
     # Phase 2 layers
     narrative_layer = GameNarrativeLayer()
-    competition_layer = GameCompetitionLayer("momentum")
+    competition_layer = GameCompetitionLayer("momentum", config.total_weeks)
 
     # Initialize game state — randomize starting regime so each seed
     # produces a different opening environment
@@ -89,12 +95,6 @@ def run_game(
         ),
         rng,
     )
-    initial_macro = MacroState(
-        regime=initial_macro.regime,
-        volatility_state=initial_macro.volatility_state,
-        rate_direction=initial_macro.rate_direction,
-        week=0,
-    )
     portfolio = PortfolioState(
         cash=config.starting_cash,
         holdings=Holdings(positions={s: 0.0 for s in Sector}),
@@ -127,13 +127,7 @@ def run_game(
             game_state.current_week = week
 
             # Advance macro state
-            new_macro = advance_macro_state(game_state.macro_state, rng)
-            new_macro = MacroState(
-                regime=new_macro.regime,
-                volatility_state=new_macro.volatility_state,
-                rate_direction=new_macro.rate_direction,
-                week=week,
-            )
+            new_macro = advance_macro_state(game_state.macro_state, rng, week=week)
             game_state.macro_state = new_macro
 
             # Generate events
@@ -188,22 +182,21 @@ def run_game(
 
             weekly_allocations.append(allocation)
 
-            # Generate returns and apply events
-            base_returns = generate_sector_returns(new_macro, rng)
-            adjusted = apply_events(base_returns, events)
+            # Generate returns and apply events (SECTOR_ORDER vectors)
+            base_returns = generate_sector_returns_array(new_macro, rng, noise)
+            adjusted = apply_events_array(base_returns, events)
 
             # Calculate portfolio return
-            fracs = allocation.as_fractions
-            portfolio_return = sum(
-                fracs[s] * adjusted[s] for s in Sector
-            )
+            portfolio_return = float(allocation.as_vector @ adjusted)
 
             # Update portfolio (floor at 0 — leverage wipeout)
             value_before = game_state.portfolio.total_value
             new_value = max(0.0, value_before * (1 + portfolio_return))
             new_cash = new_value * allocation.cash_weight
             new_holdings = Holdings(
-                positions={s: new_value * fracs[s] for s in Sector}
+                positions=dict(
+                    zip(SECTOR_ORDER, (new_value * allocation.as_vector).tolist())
+                )
             )
             game_state.portfolio = PortfolioState(
                 cash=new_cash,
@@ -213,14 +206,14 @@ def run_game(
             )
             game_state.weekly_values.append(new_value)
 
-            # Build week result
-            week_result = WeekResult(
+            # Build week result (every part was built or validated above)
+            week_result = WeekResult.model_construct(
                 week=week,
                 macro_state=new_macro,
                 allocation=allocation,
-                sector_returns=SectorReturns(returns=base_returns),
+                sector_returns=SectorReturns.from_array(base_returns),
                 events=events,
-                adjusted_returns=SectorReturns(returns=adjusted),
+                adjusted_returns=SectorReturns.from_array(adjusted),
                 portfolio_return=portfolio_return,
                 portfolio_value_before=value_before,
                 portfolio_value_after=new_value,
@@ -232,9 +225,11 @@ def run_game(
                 new_macro, adjusted, game_state, rng
             )
 
-            # Persist
-            repo.save_week(game_state.game_id, week_result, risk)
-            repo.save_rival_week(game_state.game_id, week, rival_result)
+            # Persist (save_game commits the whole week in one transaction)
+            repo.save_week(game_state.game_id, week_result, risk, commit=False)
+            repo.save_rival_week(
+                game_state.game_id, week, rival_result, commit=False
+            )
             repo.save_game(game_state)
 
             # Display results
@@ -254,11 +249,7 @@ def run_game(
         display_final_scorecard(scorecard, con=con)
 
         # Phase 2: Expanded analytics
-        weekly_returns = []
-        for i in range(1, len(game_state.weekly_values)):
-            prev = game_state.weekly_values[i - 1]
-            curr = game_state.weekly_values[i]
-            weekly_returns.append((curr - prev) / prev if prev > 0 else 0.0)
+        weekly_returns = compute_period_returns(game_state.weekly_values)
 
         if weekly_returns:
             expanded = compute_expanded_metrics(
@@ -11,7 +11,7 @@ from rich.text import Text
 from wallstreet.agents.base import RiskAssessment
 from wallstreet.models.analytics import ExpandedMetrics
 from wallstreet.models.career import CareerProfile
-from wallstreet.models.enums import Regime, Sector, VolatilityState
+from wallstreet.models.enums import SECTOR_ORDER, Regime, VolatilityState
 from wallstreet.models.events import ShockEvent
 from wallstreet.models.game import GameState, WeekResult
 from wallstreet.models.market import MacroState
@@ -129,7 +129,7 @@ def display_portfolio(
     table.add_column("Value", justify="right")
     table.add_column("Weight", justify="right")
 
-    for sector in Sector:
+    for sector in SECTOR_ORDER:
         value = portfolio.holdings.positions.get(sector, 0.0)
         weight = (value / portfolio.total_value * 100) if portfolio.total_value > 0 else 0.0
         label = sector.value
@@ -187,7 +187,7 @@ def display_week_results(week_result: WeekResult, con: Console | None = None) ->
     table.add_column("Contribution", justify="right")
 
     fracs = week_result.allocation.as_fractions
-    for sector in Sector:
+    for sector in SECTOR_ORDER:
         ret = week_result.adjusted_returns.returns[sector]
         weight = fracs[sector]
         contrib = ret * weight
@@ -1,9 +1,10 @@
 """Periodic shock event generation."""
 
 import random
+from itertools import accumulate
 
 from wallstreet.event_engine.catalog import EVENT_CATALOG
-from wallstreet.models.enums import VolatilityState
+from wallstreet.models.enums import Regime, VolatilityState
 from wallstreet.models.events import ShockEvent, ShockEventTemplate
 from wallstreet.models.market import MacroState
 
@@ -16,6 +17,34 @@ EVENT_COUNT_WEIGHTS: dict[VolatilityState, list[float]] = {
 }
 
 
+def _count_cum(weights: list[float]) -> tuple[float, float, float]:
+    """Cumulative [0, 1] thresholds plus total weight for an event count row."""
+    cum0, cum1, cum2 = accumulate(weights)
+    return cum0, cum1, cum2 + 0.0
+
+
+# Per-state thresholds so the event count is one rng.random() compare
+_COUNT_CUM: dict[VolatilityState, tuple[float, float, float]] = {
+    state: _count_cum(weights) for state, weights in EVENT_COUNT_WEIGHTS.items()
+}
+
+# Cumulative regime-affinity weights over the default catalog
+_EVENT_CUM: dict[Regime, list[float]] = {
+    regime: list(accumulate(tmpl.regime_weights[regime] for tmpl in EVENT_CATALOG))
+    for regime in Regime
+}
+
+
+def _sample_event_count(volatility_state: VolatilityState, rng: random.Random) -> int:
+    """Draw 0, 1 or 2 events for a period.
+
+    Same draw as rng.choices([0, 1, 2], weights=...), without the lists.
+    """
+    cum0, cum1, total = _COUNT_CUM[volatility_state]
+    r = rng.random() * total
+    return 0 if r < cum0 else (1 if r < cum1 else 2)
+
+
 def generate_weekly_events(
     macro_state: MacroState,
     rng: random.Random,
@@ -27,35 +56,28 @@ def generate_weekly_events(
     Event selection is weighted by regime affinity.
     Duplicate events in the same period are removed.
     """
-    if catalog is None:
-        catalog = EVENT_CATALOG
-
-    weights = EVENT_COUNT_WEIGHTS[macro_state.volatility_state]
-    num_events = rng.choices([0, 1, 2], weights=weights, k=1)[0]
+    num_events = _sample_event_count(macro_state.volatility_state, rng)
 
+    # Most low/normal-vol periods are quiet: skip all catalog work
     if num_events == 0:
         return []
 
     regime = macro_state.regime
-    event_weights = [tmpl.regime_weights[regime] for tmpl in catalog]
-
-    selected = rng.choices(catalog, weights=event_weights, k=num_events)
-
-    # Deduplicate
-    seen: set[str] = set()
-    unique: list[ShockEventTemplate] = []
-    for tmpl in selected:
-        if tmpl.name not in seen:
-            seen.add(tmpl.name)
-            unique.append(tmpl)
-
-    return [
-        ShockEvent(
-            template_name=tmpl.name,
-            description=tmpl.description,
-            sector_effects=tmpl.sector_effects,
-            vol_impact=tmpl.vol_impact,
-            week=macro_state.week,
-        )
-        for tmpl in unique
-    ]
+    if catalog is None:
+        catalog = EVENT_CATALOG
+        cum_weights = _EVENT_CUM[regime]
+    else:
+        cum_weights = list(accumulate(tmpl.regime_weights[regime] for tmpl in catalog))
+
+    selected = rng.choices(catalog, cum_weights=cum_weights, k=num_events)
+    if num_events == 1:
+        return [ShockEvent.from_template(selected[0], macro_state.week)]
+
+    # Deduplicate: at most two picks, so compare them directly
+    first, second = selected
+    if first is second or first.name == second.name:
+        unique = [first]
+    else:
+        unique = selected
+
+    return [ShockEvent.from_template(tmpl, macro_state.week) for tmpl in unique]
@@ -2,8 +2,10 @@
 
 import random
 
-from wallstreet.agents.rival_pm import RIVAL_NAMES, RivalPM
-from wallstreet.models.enums import Sector
+import numpy as np
+
+from wallstreet.agents.rival_pm import RivalPM
+from wallstreet.config import DEFAULT_TOTAL_WEEKS
 from wallstreet.models.game import GameState
 from wallstreet.models.market import MacroState
 from wallstreet.models.narrative import RivalWeekResult
@@ -12,10 +14,18 @@ from wallstreet.models.narrative import RivalWeekResult
 class GameCompetitionLayer:
     """Tracks a rival PM's performance over the course of a game."""
 
-    def __init__(self, strategy_type: str) -> None:
+    def __init__(self, strategy_type: str, total_weeks: int = DEFAULT_TOTAL_WEEKS) -> None:
         self.rival = RivalPM(strategy_type)
         self.rival_value: float = 1_000_000.0
-        self.rival_values: list[float] = [1_000_000.0]
+        # Value log preallocated for the season (starting value + one per week)
+        self._values = np.empty(total_weeks + 1, dtype=np.float64)
+        self._values[0] = self.rival_value
+        self._count = 1
+
+    @property
+    def rival_values(self) -> np.ndarray:
+        """Rival portfolio value after each processed week, starting value first."""
+        return self._values[: self._count]
 
     @property
     def rival_name(self) -> str:
@@ -28,31 +38,33 @@ class GameCompetitionLayer:
     def process_week(
         self,
         macro: MacroState,
-        adjusted_returns: dict[Sector, float],
+        adjusted_returns: np.ndarray,
         game_state: GameState,
         rng: random.Random,
     ) -> RivalWeekResult:
         """Process one week for the rival PM.
 
-        Uses the same adjusted returns (base + events) that the player faces.
+        Uses the same adjusted returns (base + events) that the player faces,
+        as a vector aligned to SECTOR_ORDER.
         """
         rival_alloc = self.rival.decide(macro, game_state, rng)
 
         # Compute rival's portfolio return
-        portfolio_return = sum(
-            rival_alloc.as_fractions[s] * adjusted_returns[s]
-            for s in Sector
-        )
+        portfolio_return = float(rival_alloc.as_vector @ adjusted_returns)
 
         value_before = self.rival_value
         self.rival_value *= (1 + portfolio_return)
-        self.rival_values.append(self.rival_value)
+        if self._count == len(self._values):
+            # Played past the expected season length: grow geometrically
+            self._values = np.concatenate((self._values, np.empty_like(self._values)))
+        self._values[self._count] = self.rival_value
+        self._count += 1
 
         return RivalWeekResult(
             rival_name=self.rival.name,
             strategy_type=self.rival.strategy_type,
             allocation=rival_alloc,
-            portfolio_return=round(portfolio_return, 6),
-            portfolio_value=round(self.rival_value, 2),
-            portfolio_value_before=round(value_before, 2),
+            portfolio_return=portfolio_return,
+            portfolio_value=self.rival_value,
+            portfolio_value_before=value_before,
         )
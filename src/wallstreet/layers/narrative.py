@@ -4,13 +4,18 @@ import random
 
 from wallstreet.agents.fed_agent import FedChairAgent
 from wallstreet.agents.headline_engine import generate_headlines
+from wallstreet.agents.rand_batch import RandBatch
 from wallstreet.agents.short_seller import ShortSellerAgent
 from wallstreet.models.events import ShockEvent
 from wallstreet.models.game import GameState
 from wallstreet.models.market import MacroState
-from wallstreet.models.narrative import FedStatement, Headline, ShortThesis, WeeklyNarrative
+from wallstreet.models.narrative import Headline, WeeklyNarrative
 from wallstreet.models.portfolio import Allocation
 
+# Upper bound on narrative draws per week: Fed (2) + headlines (up to 5)
+# + short seller (1)
+_NARRATIVE_DRAWS = 8
+
 
 class GameNarrativeLayer:
     """Orchestrates all narrative agents for a game session."""
@@ -30,10 +35,13 @@ class GameNarrativeLayer:
         """Generate all narrative elements for one week.
 
         Called after player has submitted allocation but before returns are calculated.
+        All three agents draw from one pre-drawn batch, so the week always
+        consumes the same number of draws from the game RNG.
         """
-        fed_statement = self.fed.generate(macro, rng)
-        headlines = generate_headlines(macro, events, rng)
-        short_thesis = self.short_seller.analyze(allocation, macro, game_state, rng)
+        batch = RandBatch(rng, _NARRATIVE_DRAWS)
+        fed_statement = self.fed.generate(macro, batch)
+        headlines = generate_headlines(macro, events, batch)
+        short_thesis = self.short_seller.analyze(allocation, macro, game_state, batch)
 
         return WeeklyNarrative(
             fed_statement=fed_statement,
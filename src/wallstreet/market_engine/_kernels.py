@@ -0,0 +1,40 @@
+"""Numeric kernels shared by the per-period and whole-season return paths.
+
+Both kernels work on SECTOR_ORDER vectors, or on (periods, sectors)
+matrices by broadcasting, and allocate at most a single output array that
+every step writes into in place.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+def apply_returns(
+    mean: np.ndarray, std: np.ndarray, z: np.ndarray, lo: float, hi: float
+) -> np.ndarray:
+    """Compute clip(mean + std * z)."""
+    out = np.multiply(std, z)
+    out += mean
+    return np.clip(out, lo, hi, out=out)
+
+
+def apply_effects(
+    base: np.ndarray,
+    effects: Iterable[np.ndarray],
+    lo: float,
+    hi: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Add each effect vector to base, then clip in place.
+
+    Writes into out when given (which may be base itself), otherwise into
+    a fresh copy of base.
+    """
+    if out is None:
+        out = base.copy()
+    elif out is not base:
+        np.copyto(out, base)
+    for effect in effects:
+        out += effect
+    return np.clip(out, lo, hi, out=out)
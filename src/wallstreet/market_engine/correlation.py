@@ -1,17 +1,12 @@
 """Correlation matrices and correlated normal sampling."""
 
 import random
+from collections.abc import Sequence
+from itertools import groupby
 
 import numpy as np
 
-from wallstreet.models.enums import Regime, Sector
-
-# Sector ordering for correlation matrices
-SECTOR_ORDER: list[Sector] = [
-    Sector.TECH, Sector.ENERGY, Sector.FINANCIALS,
-    Sector.CONSUMER, Sector.CONSUMER_DISC, Sector.INDUSTRIALS,
-    Sector.HEALTHCARE,
-]
+from wallstreet.models.enums import REGIME_INDEX, SECTOR_ORDER, Regime, Sector
 
 # Per-regime correlation matrices (7x7, symmetric positive-definite)
 # Order: Tech, Energy, Financials, Consumer Staples, Consumer Disc, Industrials, Healthcare
@@ -58,16 +53,57 @@ CORRELATION_MATRICES: dict[Regime, list[list[float]]] = {
     ],
 }
 
-# Pre-compute Cholesky factors for each regime
-_CHOLESKY_CACHE: dict[Regime, np.ndarray] = {}
+# All correlation matrices packed as one (4, 7, 7) tensor indexed by
+# REGIME_INDEX, and their Cholesky factors computed in a single batched
+# decomposition at import
+_CORR_TENSOR: np.ndarray = np.stack(
+    [np.asarray(CORRELATION_MATRICES[regime], dtype=np.float64) for regime in Regime]
+)
+_CHOL_TENSOR: np.ndarray = np.linalg.cholesky(_CORR_TENSOR)
 
 
 def _get_cholesky(regime: Regime) -> np.ndarray:
-    """Get (cached) Cholesky decomposition for a regime's correlation matrix."""
-    if regime not in _CHOLESKY_CACHE:
-        corr = np.array(CORRELATION_MATRICES[regime])
-        _CHOLESKY_CACHE[regime] = np.linalg.cholesky(corr)
-    return _CHOLESKY_CACHE[regime]
+    """Get the precomputed Cholesky factor for a regime's correlation matrix."""
+    return _CHOL_TENSOR[REGIME_INDEX[regime]]
+
+
+_SEED_MASK = 2**64 - 1
+
+
+class PrecomputedNoise:
+    """Correlated normals for every period of a season, drawn at game start.
+
+    One row of independent standard normals is drawn per period from a
+    NumPy PCG64 generator seeded from the game seed, then correlated under
+    every regime's Cholesky factor in a single einsum. A regime change
+    mid-season therefore needs no resampling: the period just reads the
+    row for whichever regime is active.
+    """
+
+    def __init__(self, seed: int, total_weeks: int) -> None:
+        # PCG64 rejects negative seeds; random.Random (and so the CLI and
+        # web seed) accepts any int, so wrap negatives into [0, 2**64)
+        if seed < 0:
+            seed &= _SEED_MASK
+        gen = np.random.Generator(np.random.PCG64(seed))
+        z = gen.standard_normal((total_weeks + 1, len(SECTOR_ORDER)))
+        # (regime, week, sector)
+        self._by_regime = np.einsum("rij,wj->rwi", _CHOL_TENSOR, z)
+
+    def row(self, regime: Regime, week: int) -> np.ndarray:
+        """Correlated normals for a period (indexed by week number) in SECTOR_ORDER."""
+        return self._by_regime[REGIME_INDEX[regime], week]
+
+
+def sample_correlated_normals_array(regime: Regime, rng: random.Random) -> np.ndarray:
+    """Generate 7 correlated standard normals as a vector in SECTOR_ORDER.
+
+    Uses the stdlib random.Random for reproducible seeding,
+    then applies Cholesky factor for correlation structure.
+    """
+    L = _get_cholesky(regime)
+    z_independent = np.array([rng.gauss(0, 1) for _ in range(len(SECTOR_ORDER))])
+    return L @ z_independent
 
 
 def sample_correlated_normals(
@@ -78,7 +114,50 @@ def sample_correlated_normals(
     Uses the stdlib random.Random for reproducible seeding,
     then applies Cholesky factor for correlation structure.
     """
-    L = _get_cholesky(regime)
-    z_independent = np.array([rng.gauss(0, 1) for _ in range(len(SECTOR_ORDER))])
-    z_correlated = L @ z_independent
+    z_correlated = sample_correlated_normals_array(regime, rng)
     return dict(zip(SECTOR_ORDER, z_correlated.tolist()))
+
+
+def sample_weekly_shocks_batch(
+    regime: Regime, n_periods: int, gen: np.random.Generator
+) -> np.ndarray:
+    """Sample correlated standard normals for n_periods in one regime.
+
+    Returns an (n_periods, 7) array with columns in SECTOR_ORDER.
+    """
+    return gen.multivariate_normal(
+        np.zeros(len(SECTOR_ORDER)),
+        _CORR_TENSOR[REGIME_INDEX[regime]],
+        size=n_periods,
+        method="cholesky",
+    )
+
+
+def sample_regime_path_shocks(
+    regimes: Sequence[Regime], gen: np.random.Generator
+) -> np.ndarray:
+    """Sample correlated normals for a whole regime path.
+
+    Regimes are sticky, so the path is split into runs of the same regime
+    and each run is drawn with a single batched call. Returns a
+    (len(regimes), 7) array with columns in SECTOR_ORDER.
+    """
+    shocks = np.empty((len(regimes), len(SECTOR_ORDER)))
+    start = 0
+    for regime, run in groupby(regimes):
+        length = sum(1 for _ in run)
+        shocks[start:start + length] = sample_weekly_shocks_batch(regime, length, gen)
+        start += length
+    return shocks
+
+
+def sample_correlated_normals_many(
+    regime_idx: np.ndarray, gen: np.random.Generator
+) -> np.ndarray:
+    """Sample one period of correlated normals for many simulations at once.
+
+    regime_idx holds each simulation's regime as a REGIME_INDEX position.
+    Returns an (S, 7) array with columns in SECTOR_ORDER.
+    """
+    z = gen.standard_normal((len(regime_idx), len(SECTOR_ORDER)))
+    return np.einsum("sij,sj->si", _CHOL_TENSOR[regime_idx], z)
@@ -1,6 +1,7 @@
 """Markov chain regime transitions for macro state."""
 
 import random
+from itertools import accumulate
 
 from wallstreet.models.enums import RateDirection, Regime, VolatilityState
 from wallstreet.models.market import MacroState
@@ -66,34 +67,62 @@ VOL_STATE_BY_REGIME: dict[Regime, dict[VolatilityState, float]] = {
 }
 
 
+# (outcomes, cumulative weights, total weight) — built once so sampling
+# allocates nothing per call.
+_CumulativeTable = tuple[tuple, tuple[float, ...], float]
+
+
+def _cumulative_table(options: dict) -> _CumulativeTable:
+    """Precompute the cumulative weights for a {value: probability} dict."""
+    cum = tuple(accumulate(options.values()))
+    return tuple(options), cum, cum[-1] + 0.0
+
+
+_REGIME_TABLE: dict[Regime, _CumulativeTable] = {
+    regime: _cumulative_table(row) for regime, row in REGIME_TRANSITION.items()
+}
+_RATE_TABLE: dict[Regime, _CumulativeTable] = {
+    regime: _cumulative_table(row) for regime, row in RATE_DIRECTION_BY_REGIME.items()
+}
+_VOL_TABLE: dict[Regime, _CumulativeTable] = {
+    regime: _cumulative_table(row) for regime, row in VOL_STATE_BY_REGIME.items()
+}
+
+
 def _weighted_choice(
-    options: dict[str, float], rng: random.Random
-) -> str:
-    """Pick from a dict of {value: probability} using the seeded RNG."""
-    keys = list(options.keys())
-    weights = [options[k] for k in keys]
-    return rng.choices(keys, weights=weights, k=1)[0]
+    table: _CumulativeTable, rng: random.Random
+) -> Regime | RateDirection | VolatilityState:
+    """Pick from a precomputed cumulative table using the seeded RNG.
+
+    Draws exactly like rng.choices(keys, weights=weights, k=1)[0], so a
+    given seed yields the same macro path, but with a linear scan over
+    the (at most four) cumulative weights instead of per-call lists.
+    """
+    keys, cum, total = table
+    r = rng.random() * total
+    i = 0
+    last = len(cum) - 1
+    while i < last and cum[i] <= r:
+        i += 1
+    return keys[i]
 
 
 def advance_macro_state(
-    current: MacroState, rng: random.Random
+    current: MacroState, rng: random.Random, week: int | None = None
 ) -> MacroState:
     """Transition to the next week's macro state via Markov chain.
 
     Returns a new MacroState with updated regime, rate direction,
-    and volatility state. The week field is NOT incremented here
-    (caller is responsible for setting the week).
+    and volatility state. The week field is NOT incremented here:
+    it is carried over from current unless the caller passes the
+    new state's week, which saves rebuilding the model afterwards.
     """
-    new_regime = Regime(_weighted_choice(REGIME_TRANSITION[current.regime], rng))
-    new_rate = RateDirection(
-        _weighted_choice(RATE_DIRECTION_BY_REGIME[new_regime], rng)
-    )
-    new_vol = VolatilityState(
-        _weighted_choice(VOL_STATE_BY_REGIME[new_regime], rng)
-    )
+    new_regime = _weighted_choice(_REGIME_TABLE[current.regime], rng)
+    new_rate = _weighted_choice(_RATE_TABLE[new_regime], rng)
+    new_vol = _weighted_choice(_VOL_TABLE[new_regime], rng)
     return MacroState(
         regime=new_regime,
         volatility_state=new_vol,
         rate_direction=new_rate,
-        week=current.week,
+        week=current.week if week is None else week,
     )
@@ -1,10 +1,26 @@
 """Sector return generation with regime/rate/vol modifiers."""
 
 import random
+from collections.abc import Sequence
+
+import numpy as np
 
 from wallstreet.config import MAX_WEEKLY_RETURN, MIN_WEEKLY_RETURN
-from wallstreet.market_engine.correlation import sample_correlated_normals
-from wallstreet.models.enums import RateDirection, Regime, Sector, VolatilityState
+from wallstreet.market_engine._kernels import apply_effects, apply_returns
+from wallstreet.market_engine.correlation import (
+    PrecomputedNoise,
+    sample_correlated_normals_array,
+)
+from wallstreet.models.enums import (
+    RATE_INDEX,
+    REGIME_INDEX,
+    SECTOR_ORDER,
+    VOL_INDEX,
+    RateDirection,
+    Regime,
+    Sector,
+    VolatilityState,
+)
 from wallstreet.models.events import ShockEvent
 from wallstreet.models.market import MacroState
 
@@ -89,33 +105,167 @@ VOL_SCALING: dict[VolatilityState, float] = {
 }
 
 
-def generate_sector_returns(
-    macro: MacroState, rng: random.Random
-) -> dict[Sector, float]:
-    """Generate one period of sector returns based on macro state.
+def _sector_column(
+    row: dict[Sector, tuple[float, float]], column: int
+) -> np.ndarray:
+    """One column of a per-sector parameter row, as a vector in SECTOR_ORDER."""
+    return np.array([row[s][column] for s in SECTOR_ORDER])
+
+
+# The regime and rate tables folded together at import time:
+#   EFF_MEAN[regime, rate]     = regime mean + rate mean add
+#   EFF_STD_BASE[regime, rate] = regime std * rate std multiplier
+# indexed by REGIME_INDEX and RATE_INDEX, one SECTOR_ORDER row per pair.
+EFF_MEAN: np.ndarray = np.empty((len(Regime), len(RateDirection), len(SECTOR_ORDER)))
+EFF_STD_BASE: np.ndarray = np.empty_like(EFF_MEAN)
+for _regime, _row in SECTOR_PARAMS.items():
+    for _rate, _mods in RATE_MODIFIERS.items():
+        _cell = (REGIME_INDEX[_regime], RATE_INDEX[_rate])
+        EFF_MEAN[_cell] = _sector_column(_row, 0) + _sector_column(_mods, 0)
+        EFF_STD_BASE[_cell] = _sector_column(_row, 1) * _sector_column(_mods, 1)
+del _regime, _row, _rate, _mods, _cell
+
+# EFF_STD_BASE with the volatility scaling folded in as well, indexed
+# [regime, rate, vol] by REGIME_INDEX, RATE_INDEX and VOL_INDEX: every macro
+# combination (4 x 3 x 4) gets its final std row at import time.
+_VOL_STACK: np.ndarray = np.array([VOL_SCALING[v] for v in VolatilityState])
+EFF_STD: np.ndarray = EFF_STD_BASE[:, :, None, :] * _VOL_STACK[:, None]
+
 
-    1. Look up base (mean, std) for regime + sector
-    2. Apply rate direction modifiers
-    3. Scale std by volatility state
+def generate_sector_returns_array(
+    macro: MacroState,
+    rng: random.Random,
+    noise: PrecomputedNoise | None = None,
+) -> np.ndarray:
+    """Generate one period of sector returns as a vector in SECTOR_ORDER.
+
+    1-3. Look up the (mean, std) rows for the macro state, with the rate
+         modifiers and volatility scaling already folded in (EFF_MEAN,
+         EFF_STD)
     4. Sample correlated normals
     5. Compute: return = effective_mean + effective_std * z
     6. Clamp to [-30%, +30%]
+
+    When a season's PrecomputedNoise is given, the correlated normals for
+    macro.week are read from it and rng is not consumed.
     """
-    z_values = sample_correlated_normals(macro.regime, rng)
-    vol_scale = VOL_SCALING[macro.volatility_state]
-    returns: dict[Sector, float] = {}
+    if noise is not None:
+        z = noise.row(macro.regime, macro.week)
+    else:
+        z = sample_correlated_normals_array(macro.regime, rng)
+    regime = REGIME_INDEX[macro.regime]
+    rate = RATE_INDEX[macro.rate_direction]
+    return apply_returns(
+        EFF_MEAN[regime, rate],
+        EFF_STD[regime, rate, VOL_INDEX[macro.volatility_state]],
+        z,
+        MIN_WEEKLY_RETURN,
+        MAX_WEEKLY_RETURN,
+    )
+
+
+def generate_sector_returns(
+    macro: MacroState,
+    rng: random.Random,
+    noise: PrecomputedNoise | None = None,
+) -> dict[Sector, float]:
+    """Generate one period of sector returns based on macro state.
 
-    for sector in Sector:
-        mean_base, std_base = SECTOR_PARAMS[macro.regime][sector]
-        mean_add, std_mult = RATE_MODIFIERS[macro.rate_direction][sector]
+    Dict form of generate_sector_returns_array.
+    """
+    returns = generate_sector_returns_array(macro, rng, noise)
+    return dict(zip(SECTOR_ORDER, returns.tolist()))
 
-        effective_mean = mean_base + mean_add
-        effective_std = std_base * std_mult * vol_scale
 
-        raw_return = effective_mean + effective_std * z_values[sector]
-        returns[sector] = max(MIN_WEEKLY_RETURN, min(MAX_WEEKLY_RETURN, raw_return))
+def simulate_all_weeks(
+    macro_schedule: Sequence[MacroState], z: np.ndarray
+) -> np.ndarray:
+    """Compute sector returns for a whole macro schedule in one pass.
 
-    return returns
+    z holds one row of correlated normals per scheduled period (for example
+    from sample_regime_path_shocks or PrecomputedNoise rows). Returns a
+    (len(macro_schedule), 7) array in SECTOR_ORDER, clamped to [-30%, +30%],
+    matching generate_sector_returns row by row.
+    """
+    n = len(macro_schedule)
+    regime_idx = np.fromiter(
+        (REGIME_INDEX[m.regime] for m in macro_schedule), dtype=np.intp, count=n
+    )
+    rate_idx = np.fromiter(
+        (RATE_INDEX[m.rate_direction] for m in macro_schedule), dtype=np.intp, count=n
+    )
+    vol_idx = np.fromiter(
+        (VOL_INDEX[m.volatility_state] for m in macro_schedule), dtype=np.intp, count=n
+    )
+
+    return apply_returns(
+        EFF_MEAN[regime_idx, rate_idx],
+        EFF_STD[regime_idx, rate_idx, vol_idx],
+        z,
+        MIN_WEEKLY_RETURN,
+        MAX_WEEKLY_RETURN,
+    )
+
+
+def apply_events_array(
+    base_returns: np.ndarray,
+    events: list[ShockEvent],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Additively apply shock event effects to a SECTOR_ORDER return vector.
+
+    Returns a vector clamped to [-30%, +30%]. By default it is a new array
+    and the input is not modified; pass out (a preallocated buffer, or
+    base_returns itself) to write the result there without allocating.
+    """
+    return apply_effects(
+        base_returns,
+        (event.sector_effects_vec for event in events),
+        MIN_WEEKLY_RETURN,
+        MAX_WEEKLY_RETURN,
+        out=out,
+    )
+
+
+def simulate_portfolio(
+    weights: np.ndarray, returns: np.ndarray, starting_cash: float
+) -> np.ndarray:
+    """Roll a fixed allocation through a season of returns.
+
+    weights is a SECTOR_ORDER fraction vector (Allocation.as_vector) and
+    returns a (periods, 7) matrix. Returns the value path of length
+    periods + 1, starting with starting_cash. Each period applies
+    value * (1 + weights . returns) floored at 0 (leverage wipeout), as
+    in the game loop, but as one matrix-vector product and a cumulative
+    product.
+    """
+    growth = np.empty(len(returns) + 1)
+    growth[0] = starting_cash
+    np.matmul(returns, weights, out=growth[1:])
+    growth[1:] += 1.0
+    np.maximum(growth[1:], 0.0, out=growth[1:])
+    return np.cumprod(growth, out=growth)
+
+
+def apply_events_all_weeks(
+    returns: np.ndarray, events_by_week: Sequence[Sequence[ShockEvent]]
+) -> np.ndarray:
+    """Apply each period's shock events to a whole season of returns at once.
+
+    returns is a (periods, 7) SECTOR_ORDER matrix such as simulate_all_weeks
+    produces, and events_by_week holds one event list per row. Every event
+    vector is stacked into one (events, 7) matrix and scattered onto its
+    row with a single np.add.at, so the season costs one reduction rather
+    than a Python loop per period. Rows match apply_events_array.
+    """
+    totals = np.zeros_like(returns)
+    rows = [i for i, events in enumerate(events_by_week) for _ in events]
+    if rows:
+        stacked = np.stack(
+            [event.sector_effects_vec for events in events_by_week for event in events]
+        )
+        np.add.at(totals, rows, stacked)
+    return apply_effects(returns, (totals,), MIN_WEEKLY_RETURN, MAX_WEEKLY_RETURN)
 
 
 def apply_events(
@@ -126,11 +276,6 @@ def apply_events(
 
     Clamps final returns to [-30%, +30%].
     """
-    adjusted = dict(base_returns)
-    for event in events:
-        for sector, effect in event.sector_effects.items():
-            adjusted[sector] = adjusted.get(sector, 0.0) + effect
-    return {
-        s: max(MIN_WEEKLY_RETURN, min(MAX_WEEKLY_RETURN, r))
-        for s, r in adjusted.items()
-    }
+    base = np.array([base_returns.get(s, 0.0) for s in SECTOR_ORDER])
+    apply_events_array(base, events, out=base)
+    return dict(zip(SECTOR_ORDER, base.tolist()))
@@ -0,0 +1,24 @@
+"""Shared base for models that cache NumPy views of their fields."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ArrayBackedModel(BaseModel):
+    """BaseModel whose non-field state only caches values derived from fields.
+
+    Pydantic's default equality also compares private attributes and the
+    instance ``__dict__``, and NumPy arrays have no single truth value, so
+    comparing two models that both built their caches would raise. Since
+    the caches are a pure function of the fields, equality compares the
+    fields alone.
+    """
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        mine, theirs = self.__dict__, other.__dict__
+        return all(mine[name] == theirs[name] for name in type(self).model_fields)
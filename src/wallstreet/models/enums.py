@@ -35,3 +35,15 @@ class RateDirection(str, Enum):
     RISING = "rising"
     STABLE = "stable"
     FALLING = "falling"
+
+
+# Canonical sector ordering for array-backed (vectorized) computations
+SECTOR_ORDER: tuple[Sector, ...] = tuple(Sector)
+SECTOR_INDEX: dict[Sector, int] = {s: i for i, s in enumerate(SECTOR_ORDER)}
+
+# Ordinal of each macro member (declaration order), used to index the
+# precomputed parameter tensors. Members stay string-valued for
+# persistence and display.
+REGIME_INDEX: dict[Regime, int] = {r: i for i, r in enumerate(Regime)}
+VOL_INDEX: dict[VolatilityState, int] = {v: i for i, v in enumerate(VolatilityState)}
+RATE_INDEX: dict[RateDirection, int] = {d: i for i, d in enumerate(RateDirection)}
@@ -1,25 +1,135 @@
 """Shock event data models."""
 
-from pydantic import BaseModel, Field
+import sys
 
-from wallstreet.models.enums import Regime, Sector
+import numpy as np
+from pydantic import (
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
+from wallstreet.models.base import ArrayBackedModel
+from wallstreet.models.enums import SECTOR_INDEX, SECTOR_ORDER, Regime, Sector
 
-class ShockEventTemplate(BaseModel):
+
+def _effects_vector(sector_effects: dict[Sector, float]) -> np.ndarray:
+    """Lay out a sector -> effect mapping as a dense SECTOR_ORDER vector.
+
+    Sectors the event does not touch are zero. The vector is read-only
+    because catalog templates share it with every event they produce.
+    """
+    vec = np.zeros(len(SECTOR_ORDER), dtype=np.float64)
+    for sector, effect in sector_effects.items():
+        vec[SECTOR_INDEX[sector]] = effect
+    vec.setflags(write=False)
+    return vec
+
+
+_SECTOR_EFFECTS_JSON = TypeAdapter(dict[Sector, float])
+
+
+def _effects_json(sector_effects: dict[Sector, float]) -> str:
+    """Compact JSON for a sector -> effect mapping, keyed by sector value."""
+    return _SECTOR_EFFECTS_JSON.dump_json(sector_effects).decode()
+
+
+class ShockEventTemplate(ArrayBackedModel):
     """Definition of a possible shock event in the catalog."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     sector_effects: dict[Sector, float]
     vol_impact: float = Field(default=0.0)
     regime_weights: dict[Regime, float]
 
+    _sector_effects_vec: np.ndarray | None = PrivateAttr(default=None)
+    _sector_effects_json: str | None = PrivateAttr(default=None)
+
+    @field_validator("name", "description")
+    @classmethod
+    def intern_text(cls, value: str) -> str:
+        # Events instantiated from a template share these strings, and name
+        # lookups compare by identity first
+        return sys.intern(value)
+
+    @model_validator(mode="after")
+    def build_effects_vec(self) -> "ShockEventTemplate":
+        self._sector_effects_vec = _effects_vector(self.sector_effects)
+        return self
 
-class ShockEvent(BaseModel):
+    @property
+    def sector_effects_vec(self) -> np.ndarray:
+        """Sector effects as a float64 vector aligned to SECTOR_ORDER."""
+        # model_construct() skips the validator
+        if self._sector_effects_vec is None:
+            self._sector_effects_vec = _effects_vector(self.sector_effects)
+        return self._sector_effects_vec
+
+    @property
+    def sector_effects_json(self) -> str:
+        """Sector effects as JSON, built once and shared by every event."""
+        if self._sector_effects_json is None:
+            self._sector_effects_json = _effects_json(self.sector_effects)
+        return self._sector_effects_json
+
+
+class ShockEvent(ArrayBackedModel):
     """An instantiated shock event that occurred in a specific week."""
 
+    model_config = ConfigDict(frozen=True)
+
     template_name: str
     description: str
     sector_effects: dict[Sector, float]
     vol_impact: float
     week: int
+
+    _sector_effects_vec: np.ndarray | None = PrivateAttr(default=None)
+    _sector_effects_json: str | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def build_effects_vec(self) -> "ShockEvent":
+        self._sector_effects_vec = _effects_vector(self.sector_effects)
+        return self
+
+    @classmethod
+    def from_template(cls, template: ShockEventTemplate, week: int) -> "ShockEvent":
+        """Instantiate a template for a week.
+
+        The template was validated when the catalog was built, so the event
+        is assembled without re-validation and shares the template's name,
+        description, read-only effect vector and effects JSON by reference.
+        The effects mapping is copied so that writes to an event's dict
+        cannot reach the catalog.
+        """
+        event = cls.model_construct(
+            template_name=template.name,
+            description=template.description,
+            sector_effects=dict(template.sector_effects),
+            vol_impact=template.vol_impact,
+            week=week,
+        )
+        event._sector_effects_vec = template.sector_effects_vec
+        event._sector_effects_json = template.sector_effects_json
+        return event
+
+    @property
+    def sector_effects_vec(self) -> np.ndarray:
+        """Sector effects as a float64 vector aligned to SECTOR_ORDER."""
+        # model_construct() skips the validator
+        if self._sector_effects_vec is None:
+            self._sector_effects_vec = _effects_vector(self.sector_effects)
+        return self._sector_effects_vec
+
+    @property
+    def sector_effects_json(self) -> str:
+        """Sector effects as compact JSON keyed by sector value."""
+        if self._sector_effects_json is None:
+            self._sector_effects_json = _effects_json(self.sector_effects)
+        return self._sector_effects_json
@@ -3,17 +3,18 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from wallstreet.models.enums import Sector
 from wallstreet.models.events import ShockEvent
 from wallstreet.models.market import MacroState, SectorReturns
-from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
+from wallstreet.models.portfolio import Allocation, PortfolioState
 
 
 class GameConfig(BaseModel):
     """Configuration for a game session."""
 
+    model_config = ConfigDict(frozen=True)
+
     seed: int
     starting_cash: float = 1_000_000.0
     total_weeks: int = 26
@@ -1,13 +1,23 @@
 """Market-related data models."""
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from wallstreet.models.enums import Regime, RateDirection, Sector, VolatilityState
+from wallstreet.models.base import ArrayBackedModel
+from wallstreet.models.enums import (
+    SECTOR_ORDER,
+    Regime,
+    RateDirection,
+    Sector,
+    VolatilityState,
+)
 
 
 class MacroState(BaseModel):
     """Current macroeconomic environment."""
 
+    model_config = ConfigDict(frozen=True)
+
     regime: Regime
     volatility_state: VolatilityState
     rate_direction: RateDirection
@@ -25,7 +35,37 @@ class MacroState(BaseModel):
         return regime_desc[self.regime]
 
 
-class SectorReturns(BaseModel):
-    """Weekly returns for all sectors."""
+class SectorReturns(ArrayBackedModel):
+    """Weekly returns for all sectors.
+
+    The dict is the serialized form; engine math reads as_array, a vector
+    aligned to SECTOR_ORDER.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     returns: dict[Sector, float]
+
+    _arr: np.ndarray | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "SectorReturns":
+        """Wrap an engine-produced SECTOR_ORDER vector, keeping a copy as as_array.
+
+        Validating a seven-entry dict is cheaper than model_construct()
+        plus setting the private attribute, so this goes through the normal
+        constructor. The copy is read-only, so later in-place writes to the
+        caller's array cannot drift as_array away from ``returns``.
+        """
+        result = cls(returns=dict(zip(SECTOR_ORDER, arr.tolist())))
+        result._arr = arr.copy()
+        result._arr.setflags(write=False)
+        return result
+
+    @property
+    def as_array(self) -> np.ndarray:
+        """Returns as a read-only float64 vector aligned to SECTOR_ORDER."""
+        if self._arr is None:
+            self._arr = np.array([self.returns[s] for s in SECTOR_ORDER])
+            self._arr.setflags(write=False)
+        return self._arr
@@ -1,12 +1,16 @@
 """Portfolio and allocation data models."""
 
-from pydantic import BaseModel, Field, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from wallstreet.config import MAX_GROSS_EXPOSURE, MAX_SHORT_PER_SECTOR
-from wallstreet.models.enums import Sector
+from wallstreet.models.base import ArrayBackedModel
+from wallstreet.models.enums import SECTOR_ORDER, Sector
 
+_SECTOR_SET: frozenset[Sector] = frozenset(SECTOR_ORDER)
 
-class Allocation(BaseModel):
+
+class Allocation(ArrayBackedModel):
     """Player's chosen allocation across sectors.
 
     Percentages must sum to 0-100% (net exposure). The remainder is
@@ -16,60 +20,119 @@ class Allocation(BaseModel):
     MAX_SHORT_PER_SECTOR (-50%).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     weights: dict[Sector, float]
 
+    _vector: np.ndarray | None = PrivateAttr(default=None)
+    _fractions: dict[Sector, float] | None = PrivateAttr(default=None)
+    _net_exposure: float | None = PrivateAttr(default=None)
+    _gross_exposure: float | None = PrivateAttr(default=None)
+    _cash_weight: float | None = PrivateAttr(default=None)
+    _short_sectors: tuple[Sector, ...] | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_weights(self) -> "Allocation":
-        total = sum(self.weights.values())
+        # One pass gathers everything the checks below need; the checks
+        # still raise in the same order (net, short, gross, sectors)
+        total = 0.0
+        gross = 0.0
+        too_short: tuple[Sector, float] | None = None
+        for sector, weight in self.weights.items():
+            total += weight
+            if weight < 0:
+                gross -= weight
+                if weight < MAX_SHORT_PER_SECTOR and too_short is None:
+                    too_short = (sector, weight)
+            else:
+                gross += weight
         if total < -0.01 or total > 100.01:
             raise ValueError(
                 f"Allocation must sum to 0-100%, got {total:.2f}%"
             )
-        for sector, weight in self.weights.items():
-            if weight < MAX_SHORT_PER_SECTOR:
-                raise ValueError(
-                    f"Short position too large for {sector.value}: {weight}% "
-                    f"(max short is {MAX_SHORT_PER_SECTOR}%)"
-                )
-        gross = sum(abs(w) for w in self.weights.values())
+        if too_short is not None:
+            sector, weight = too_short
+            raise ValueError(
+                f"Short position too large for {sector.value}: {weight}% "
+                f"(max short is {MAX_SHORT_PER_SECTOR}%)"
+            )
         if gross > MAX_GROSS_EXPOSURE + 0.01:
             raise ValueError(
                 f"Gross exposure {gross:.1f}% exceeds {MAX_GROSS_EXPOSURE:.0f}% limit"
             )
-        if set(self.weights.keys()) != set(Sector):
+        if self.weights.keys() != _SECTOR_SET:
             raise ValueError("Allocation must include all 7 sectors")
+        # Keep the sums for the derived properties
+        self._net_exposure = total / 100.0
+        self._gross_exposure = gross / 100.0
+        self._cash_weight = (100.0 - total) / 100.0
         return self
 
     @property
     def as_fractions(self) -> dict[Sector, float]:
-        """Return weights as decimal fractions (can be negative for shorts)."""
-        return {s: w / 100.0 for s, w in self.weights.items()}
+        """Return weights as decimal fractions (can be negative for shorts).
+
+        Built once and shared between calls; treat it as read-only.
+        """
+        if self._fractions is None:
+            self._fractions = {s: w / 100.0 for s, w in self.weights.items()}
+        return self._fractions
+
+    @property
+    def as_vector(self) -> np.ndarray:
+        """Weights as decimal fractions in a read-only SECTOR_ORDER vector."""
+        if self._vector is None:
+            self._vector = np.array([self.weights[s] / 100.0 for s in SECTOR_ORDER])
+            self._vector.setflags(write=False)
+        return self._vector
+
+    @property
+    def net_exposure(self) -> float:
+        """Net exposure as a fraction (1.0 = fully invested, 0.0 = all cash)."""
+        if self._net_exposure is None:
+            self._net_exposure = sum(self.weights.values()) / 100.0
+        return self._net_exposure
 
     @property
     def gross_exposure(self) -> float:
         """Gross exposure as a fraction (1.0 = long-only, 2.0 = max leverage)."""
-        return sum(abs(w) for w in self.weights.values()) / 100.0
+        if self._gross_exposure is None:
+            self._gross_exposure = sum(abs(w) for w in self.weights.values()) / 100.0
+        return self._gross_exposure
 
     @property
     def cash_weight(self) -> float:
         """Fraction of portfolio held as cash (0.0 = fully invested)."""
-        return (100.0 - sum(self.weights.values())) / 100.0
+        if self._cash_weight is None:
+            self._cash_weight = (100.0 - sum(self.weights.values())) / 100.0
+        return self._cash_weight
+
+    @property
+    def short_sectors(self) -> tuple[Sector, ...]:
+        """Sectors held short, in the order of ``weights``."""
+        if self._short_sectors is None:
+            self._short_sectors = tuple(s for s, w in self.weights.items() if w < 0)
+        return self._short_sectors
 
     @property
     def has_shorts(self) -> bool:
         """Whether the allocation contains any short positions."""
-        return any(w < 0 for w in self.weights.values())
+        return bool(self.short_sectors)
 
 
 class Holdings(BaseModel):
     """Dollar-denominated holdings per sector."""
 
+    model_config = ConfigDict(frozen=True)
+
     positions: dict[Sector, float]
 
 
 class PortfolioState(BaseModel):
     """Full snapshot of portfolio at a point in time."""
 
+    model_config = ConfigDict(frozen=True)
+
     cash: float = Field(ge=0)
     holdings: Holdings
     total_value: float
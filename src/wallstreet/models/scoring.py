@@ -1,11 +1,13 @@
 """Scorecard data model for final game results."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ScoreCard(BaseModel):
     """Final performance metrics for a completed game."""
 
+    model_config = ConfigDict(frozen=True)
+
     initial_value: float
     final_value: float
     total_return_pct: float
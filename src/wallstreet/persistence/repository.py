@@ -1,6 +1,5 @@
 """CRUD operations for game persistence in SQLite."""
 
-import json
 import sqlite3
 from datetime import datetime
 
@@ -10,7 +9,51 @@ from wallstreet.models.career import CareerProfile, CareerTitle
 from wallstreet.models.game import GameState, WeekResult
 from wallstreet.models.narrative import RivalWeekResult
 from wallstreet.models.scoring import ScoreCard
-from wallstreet.persistence.schema import CREATE_TABLES, SCHEMA_VERSION
+from wallstreet.persistence.schema import INIT_SCHEMA
+
+# Statements run every week, kept as single module-level strings; the
+# sqlite3 statement cache (keyed by SQL text) reuses their prepared form.
+_SQL_UPSERT_GAME = """
+INSERT INTO games (
+    game_id, player_name, seed, starting_cash, total_weeks,
+    current_week, is_complete, created_at, updated_at, config_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(game_id) DO UPDATE SET
+    current_week = excluded.current_week,
+    is_complete = excluded.is_complete,
+    updated_at = excluded.updated_at
+"""
+
+_SQL_UPDATE_GAME_PROGRESS = """
+UPDATE games SET
+    current_week = ?,
+    is_complete = ?,
+    updated_at = ?
+WHERE game_id = ?
+"""
+
+_SQL_SAVE_WEEK = """
+INSERT OR REPLACE INTO weekly_snapshots (
+    game_id, week, regime, volatility_state, rate_direction,
+    portfolio_value, allocation_json, sector_returns_json,
+    adjusted_returns_json, portfolio_return,
+    risk_score, risk_critique, week_result_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_EVENT = """
+INSERT INTO events_log (
+    game_id, week, event_name, event_description,
+    sector_effects_json, vol_impact
+) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_RIVAL = """
+INSERT OR REPLACE INTO rival_snapshots (
+    game_id, week, rival_name, strategy_type,
+    allocation_json, portfolio_value, portfolio_return
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class GameRepository:
@@ -19,20 +62,19 @@ class GameRepository:
     def __init__(self, db_path: str = DEFAULT_DB_PATH) -> None:
         self.db_path = db_path
         self.conn: sqlite3.Connection | None = None
+        # Games this repository has already inserted a row for
+        self._saved_game_ids: set[str] = set()
 
     def initialize(self) -> None:
         """Create connection and ensure schema exists."""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
-        self.conn.executescript(CREATE_TABLES)
-        # Check / insert schema version
-        cursor = self.conn.execute("SELECT COUNT(*) FROM schema_version")
-        if cursor.fetchone()[0] == 0:
-            self.conn.execute(
-                "INSERT INTO schema_version (version) VALUES (?)",
-                (SCHEMA_VERSION,),
-            )
-        self.conn.commit()
+        # WAL keeps the per-week writes off the rollback-journal fsync path;
+        # NORMAL only syncs at checkpoints, which is safe in WAL mode.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Tables, indexes and the schema version row in one call
+        self.conn.executescript(INIT_SCHEMA)
 
     def _ensure_conn(self) -> sqlite3.Connection:
         if self.conn is None:
@@ -40,20 +82,24 @@ class GameRepository:
         return self.conn
 
     def save_game(self, game_state: GameState) -> None:
-        """Upsert the game record."""
+        """Upsert the game record.
+
+        Once a game's row exists only its progress columns change, so later
+        saves update those and skip re-serializing the config.
+        """
         conn = self._ensure_conn()
         now = datetime.now().isoformat()
+        is_complete = 1 if game_state.is_complete else 0
+        if game_state.game_id in self._saved_game_ids:
+            cursor = conn.execute(
+                _SQL_UPDATE_GAME_PROGRESS,
+                (game_state.current_week, is_complete, now, game_state.game_id),
+            )
+            if cursor.rowcount:
+                conn.commit()
+                return
         conn.execute(
-            """
-            INSERT INTO games (
-                game_id, player_name, seed, starting_cash, total_weeks,
-                current_week, is_complete, created_at, updated_at, config_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(game_id) DO UPDATE SET
-                current_week = excluded.current_week,
-                is_complete = excluded.is_complete,
-                updated_at = excluded.updated_at
-            """,
+            _SQL_UPSERT_GAME,
             (
                 game_state.game_id,
                 game_state.config.player_name,
@@ -61,31 +107,30 @@ class GameRepository:
                 game_state.config.starting_cash,
                 game_state.config.total_weeks,
                 game_state.current_week,
-                1 if game_state.is_complete else 0,
+                is_complete,
                 game_state.created_at.isoformat(),
                 now,
                 game_state.config.model_dump_json(),
             ),
         )
         conn.commit()
+        self._saved_game_ids.add(game_state.game_id)
 
     def save_week(
         self,
         game_id: str,
         week_result: WeekResult,
         risk: RiskAssessment | None = None,
+        commit: bool = True,
     ) -> None:
-        """Insert a weekly snapshot and associated events."""
+        """Insert a weekly snapshot and associated events.
+
+        Pass ``commit=False`` to leave the rows in the open transaction for
+        a later commit (e.g. ``save_game`` or ``flush``).
+        """
         conn = self._ensure_conn()
         conn.execute(
-            """
-            INSERT OR REPLACE INTO weekly_snapshots (
-                game_id, week, regime, volatility_state, rate_direction,
-                portfolio_value, allocation_json, sector_returns_json,
-                adjusted_returns_json, portfolio_return,
-                risk_score, risk_critique, week_result_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_SAVE_WEEK,
             (
                 game_id,
                 week_result.week,
@@ -103,26 +148,23 @@ class GameRepository:
             ),
         )
         # Log events
-        for event in week_result.events:
-            conn.execute(
-                """
-                INSERT INTO events_log (
-                    game_id, week, event_name, event_description,
-                    sector_effects_json, vol_impact
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    game_id,
-                    week_result.week,
-                    event.template_name,
-                    event.description,
-                    json.dumps(
-                        {s.value: v for s, v in event.sector_effects.items()}
-                    ),
-                    event.vol_impact,
-                ),
+        if week_result.events:
+            conn.executemany(
+                _SQL_SAVE_EVENT,
+                [
+                    (
+                        game_id,
+                        week_result.week,
+                        event.template_name,
+                        event.description,
+                        event.sector_effects_json,
+                        event.vol_impact,
+                    )
+                    for event in week_result.events
+                ],
             )
-        conn.commit()
+        if commit:
+            conn.commit()
 
     def save_scorecard(self, game_id: str, scorecard: ScoreCard) -> None:
         """Write final scores to the games table."""
@@ -214,17 +256,19 @@ class GameRepository:
         )
 
     def save_rival_week(
-        self, game_id: str, week: int, result: RivalWeekResult
+        self,
+        game_id: str,
+        week: int,
+        result: RivalWeekResult,
+        commit: bool = True,
     ) -> None:
-        """Save a rival PM's weekly snapshot."""
+        """Save a rival PM's weekly snapshot.
+
+        ``commit=False`` defers the commit, as in ``save_week``.
+        """
         conn = self._ensure_conn()
         conn.execute(
-            """
-            INSERT OR REPLACE INTO rival_snapshots (
-                game_id, week, rival_name, strategy_type,
-                allocation_json, portfolio_value, portfolio_return
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_SAVE_RIVAL,
             (
                 game_id,
                 week,
@@ -235,7 +279,12 @@ class GameRepository:
                 result.portfolio_return,
             ),
         )
-        conn.commit()
+        if commit:
+            conn.commit()
+
+    def flush(self) -> None:
+        """Commit any writes left pending by ``commit=False`` saves."""
+        self._ensure_conn().commit()
 
     def close(self) -> None:
         """Close the DB connection."""
@@ -83,3 +83,10 @@ CREATE INDEX IF NOT EXISTS idx_events_game_week
 CREATE INDEX IF NOT EXISTS idx_rival_game_week
     ON rival_snapshots(game_id, week);
 """
+
+# Everything initialize() runs, as one script: the DDL above plus the
+# schema_version row on a fresh database
+INIT_SCHEMA = CREATE_TABLES + f"""
+INSERT INTO schema_version (version)
+    SELECT {SCHEMA_VERSION} WHERE NOT EXISTS (SELECT 1 FROM schema_version);
+"""
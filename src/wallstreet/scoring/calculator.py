@@ -1,95 +1,152 @@
 """Performance metric calculations."""
 
 import math
+from collections.abc import Sequence
+
+import numpy as np
 
 from wallstreet.models.scoring import ScoreCard
 
+_SQRT12 = math.sqrt(12)
+
 
 def compute_cagr(initial: float, final: float, weeks: int) -> float:
     """Compute annualized return (CAGR).
 
-    Annualizes using 12 months/year: (final/initial)^(12/periods) - 1
+    Annualizes using 12 months/year: (final/initial)^(12/periods) - 1,
+    evaluated as expm1(log(final/initial) * 12/periods), which stays
+    accurate when the annualized return is close to zero.
     """
     if initial <= 0 or final <= 0 or weeks <= 0:
         return -1.0
-    years_fraction = weeks / 12.0
-    return (final / initial) ** (1.0 / years_fraction) - 1.0
+    return math.expm1(math.log(final / initial) * 12.0 / weeks)
+
+
+def _period_returns(values: np.ndarray) -> np.ndarray:
+    """Simple returns between consecutive values.
+
+    A period that starts from 0 (a wiped-out portfolio) has return 0.0.
+    """
+    prev = values[:-1]
+    return np.divide(
+        values[1:] - prev, prev, out=np.zeros(len(prev)), where=prev > 0
+    )
+
+
+def compute_max_drawdown_arr(values: np.ndarray) -> float:
+    """compute_max_drawdown for a value series already in a float64 array.
+
+    Runs as two C loops (running peak, then drawdown) over one scratch
+    array besides the peaks, with no per-element Python work.
+    """
+    if len(values) < 2:
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    drawdowns = np.subtract(values, peaks)
+    drawdowns /= peaks
+    return float(drawdowns.min())
+
+
+def _mean_and_volatility(returns: np.ndarray) -> tuple[float, float]:
+    """Mean and annualized sample volatility of a return series.
+
+    The mean is taken once and shared with the variance, which is a single
+    dot product of the deviations (no squared temporary). Fewer than two
+    returns give (mean, 0.0).
+    """
+    n = len(returns)
+    if n == 0:
+        return 0.0, 0.0
+    mean = float(returns.mean())
+    if n < 2:
+        return mean, 0.0
+    deviations = returns - mean
+    variance = float(deviations @ deviations) / (n - 1)
+    return mean, math.sqrt(variance) * _SQRT12
+
+
+def _sharpe_ratio(mean: float, ann_vol: float, risk_free_rate: float = 0.0) -> float:
+    """Sharpe ratio from a series' mean return and annualized vol."""
+    if ann_vol < 1e-10:
+        return 0.0
+    return (mean * 12 - risk_free_rate) / ann_vol
 
 
-def compute_max_drawdown(weekly_values: list[float]) -> float:
+def compute_max_drawdown(weekly_values: Sequence[float]) -> float:
     """Compute maximum peak-to-trough drawdown.
 
     Returns a negative number (e.g., -0.15 for 15% drawdown).
     Returns 0.0 if values only increase.
     """
-    if len(weekly_values) < 2:
-        return 0.0
-    peak = weekly_values[0]
-    max_dd = 0.0
-    for value in weekly_values[1:]:
-        if value > peak:
-            peak = value
-        dd = (value - peak) / peak
-        if dd < max_dd:
-            max_dd = dd
-    return max_dd
-
-
-def compute_annualized_volatility(weekly_returns: list[float]) -> float:
+    return compute_max_drawdown_arr(np.asarray(weekly_values, dtype=np.float64))
+
+
+def compute_annualized_volatility(weekly_returns: Sequence[float]) -> float:
     """Annualized volatility from monthly returns.
 
     ann_vol = monthly_std * sqrt(12)
     Uses sample standard deviation (n-1 denominator).
     """
-    if len(weekly_returns) < 2:
-        return 0.0
-    n = len(weekly_returns)
-    mean = sum(weekly_returns) / n
-    variance = sum((r - mean) ** 2 for r in weekly_returns) / (n - 1)
-    weekly_std = math.sqrt(variance)
-    return weekly_std * math.sqrt(12)
+    _, ann_vol = _mean_and_volatility(np.asarray(weekly_returns, dtype=np.float64))
+    return ann_vol
 
 
 def compute_sharpe_ratio(
-    weekly_returns: list[float], risk_free_rate: float = 0.0
+    weekly_returns: Sequence[float], risk_free_rate: float = 0.0
 ) -> float:
     """Sharpe ratio (annualized return / annualized vol).
 
     Uses simple annualization: mean_monthly * 12 for return.
     """
-    if len(weekly_returns) < 2:
-        return 0.0
-    ann_vol = compute_annualized_volatility(weekly_returns)
-    if ann_vol < 1e-10:
-        return 0.0
-    mean_weekly = sum(weekly_returns) / len(weekly_returns)
-    ann_return = mean_weekly * 12
-    return (ann_return - risk_free_rate) / ann_vol
+    mean, ann_vol = _mean_and_volatility(
+        np.asarray(weekly_returns, dtype=np.float64)
+    )
+    return _sharpe_ratio(mean, ann_vol, risk_free_rate)
+
 
+def compute_period_returns(weekly_values: Sequence[float]) -> list[float]:
+    """Simple weekly returns from a value series (0.0 after a wipeout)."""
+    return _period_returns(np.asarray(weekly_values, dtype=np.float64)).tolist()
 
-def compute_scorecard(weekly_values: list[float]) -> ScoreCard:
+
+def _compute_all(
+    values: np.ndarray,
+) -> tuple[float, float, float, float, float]:
+    """Every series statistic the scorecard needs, from one float64 array.
+
+    Returns (initial, final, max_drawdown, mean_return, annualized_vol).
+    """
+    mean_return, ann_vol = _mean_and_volatility(_period_returns(values))
+    return (
+        float(values[0]),
+        float(values[-1]),
+        compute_max_drawdown_arr(values),
+        mean_return,
+        ann_vol,
+    )
+
+
+def compute_scorecard(weekly_values: Sequence[float]) -> ScoreCard:
     """Compute all scoring metrics from weekly portfolio values.
 
+    The values are converted to one float64 array, and every metric is
+    derived from it and a single array of period returns.
+
     Args:
         weekly_values: List of portfolio values, length = total_weeks + 1
                        (index 0 = initial value).
     """
-    initial = weekly_values[0]
-    final = weekly_values[-1]
-    weeks = len(weekly_values) - 1
-
-    weekly_returns = [
-        (weekly_values[i] - weekly_values[i - 1]) / weekly_values[i - 1]
-        for i in range(1, len(weekly_values))
-    ]
+    values = np.asarray(weekly_values, dtype=np.float64)
+    initial, final, max_dd, mean_return, ann_vol = _compute_all(values)
+    weeks = len(values) - 1
 
     return ScoreCard(
         initial_value=initial,
         final_value=final,
         total_return_pct=(final - initial) / initial * 100,
         cagr=compute_cagr(initial, final, weeks),
-        max_drawdown=compute_max_drawdown(weekly_values),
-        annualized_volatility=compute_annualized_volatility(weekly_returns),
-        sharpe_ratio=compute_sharpe_ratio(weekly_returns),
+        max_drawdown=max_dd,
+        annualized_volatility=ann_vol,
+        sharpe_ratio=_sharpe_ratio(mean_return, ann_vol),
         total_weeks=weeks,
     )
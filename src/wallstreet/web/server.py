@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import functools
+import hashlib
 import logging
+import mimetypes
+import weakref
 from pathlib import Path
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from rich.console import Console
+from starlette.types import Scope
 
 from wallstreet.cli.app import run_game
 from wallstreet.models.game import GameConfig
@@ -19,30 +23,131 @@ logger = logging.getLogger(__name__)
 
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Asset names carry no content hash, so browsers may reuse them for a day
+# and then revalidate against the ETag StaticFiles already sends.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+# The page always revalidates; an unchanged page costs a bodiless 304.
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to every response."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+        return response
+
+
 app = FastAPI(title="Wall Street War Room")
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
+
+# path -> (body, quoted ETag), read once per process
+_file_cache: dict[Path, tuple[bytes, str]] = {}
+
+
+def cached_file_response(path: Path, request: Request) -> Response:
+    """Serve a file from memory with an ETag, reading it on first use.
+
+    Answers 304 when the request's If-None-Match already holds the ETag.
+    """
+    cached = _file_cache.get(path)
+    if cached is None:
+        body = path.read_bytes()
+        cached = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        _file_cache[path] = cached
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": INDEX_CACHE_CONTROL}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 @app.get("/")
-async def index() -> FileResponse:
+async def index(request: Request) -> Response:
     """Serve the main HTML page."""
-    return FileResponse(str(STATIC_DIR / "index.html"))
+    return cached_file_response(STATIC_DIR / "index.html", request)
+
+
+# ── keepalive ─────────────────────────────────────────────────────────
+
+KEEPALIVE_INTERVAL = 30.0
+
+# Open game sockets, pinged together by one shared task
+_keepalive_sockets: weakref.WeakSet[WebSocket] = weakref.WeakSet()
+_keepalive_task: asyncio.Task[None] | None = None
+
+
+async def _keepalive_loop() -> None:
+    """Ping every open socket every 30s to prevent proxy idle timeouts.
+
+    Exits once no sockets are left; the next connection restarts it.
+    """
+    while _keepalive_sockets:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        # Empty ping frames; a socket that fails is dropped by its handler
+        await asyncio.gather(
+            *(ws.send_bytes(b"") for ws in list(_keepalive_sockets)),
+            return_exceptions=True,
+        )
+
+
+def _start_keepalive(ws: WebSocket) -> None:
+    """Add a socket to the shared keepalive, starting the task if needed."""
+    global _keepalive_task
+    _keepalive_sockets.add(ws)
+    if _keepalive_task is None or _keepalive_task.done():
+        _keepalive_task = asyncio.get_running_loop().create_task(_keepalive_loop())
+
+
+class _Utf8Buffer:
+    """Minimal text file for Rich that stores its output UTF-8 encoded.
+
+    Text is encoded once as Rich writes it, so flushing hands the bytes
+    straight to ``send_bytes`` with no further encode pass.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write(self, text: str) -> int:
+        self.data += text.encode("utf-8", "replace")
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        """Return everything written so far and empty the buffer."""
+        data = bytes(self.data)
+        self.data.clear()
+        return data
 
 
 class WebSocketBridge:
     """Bridges the synchronous game loop I/O with an async WebSocket.
 
     The game loop runs in a background thread. Rich Console writes to a
-    StringIO buffer; ``flush_output()`` sends the buffered ANSI text to
-    the browser. ``sync_input()`` blocks the game thread until the
-    browser sends a line of text.
+    UTF-8 byte buffer; ``flush_output()`` hands the buffered ANSI bytes to
+    a writer task on the event loop, which sends them to the browser as
+    binary frames.
+    ``sync_input()`` blocks the game thread until the browser sends a
+    line of text.
     """
 
     def __init__(self, ws: WebSocket, loop: asyncio.AbstractEventLoop) -> None:
         self.ws = ws
         self.loop = loop
         self.input_queue: asyncio.Queue[str] = asyncio.Queue()
-        self.output_buffer = io.StringIO()
+        # Output chunks waiting for the writer task; None stops it
+        self.output_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self.writer_task = loop.create_task(self._write_output())
+        # Set by the writer if a send fails; the game thread re-raises it
+        self.send_error: BaseException | None = None
+        self.output_buffer = _Utf8Buffer()
         self.console = Console(
             file=self.output_buffer,
             force_terminal=True,
@@ -53,15 +158,54 @@ class WebSocketBridge:
     # ── output ────────────────────────────────────────────────────────
 
     def flush_output(self) -> None:
-        """Send buffered ANSI output to the WebSocket (game thread)."""
-        text = self.output_buffer.getvalue()
-        if text:
-            future = asyncio.run_coroutine_threadsafe(
-                self.ws.send_text(text), self.loop
-            )
-            future.result(timeout=10)
-            self.output_buffer.truncate(0)
-            self.output_buffer.seek(0)
+        """Queue buffered ANSI output for the WebSocket (game thread).
+
+        Does not wait for the send; the writer task delivers chunks in
+        order. Raises the writer's error once a send has failed (e.g. the
+        client disconnected), which ends the game thread.
+        """
+        if self.send_error is not None:
+            raise self.send_error
+        if self.output_buffer.data:
+            data = self.output_buffer.take()
+            self.loop.call_soon_threadsafe(self.output_queue.put_nowait, data)
+
+    async def _write_output(self) -> None:
+        """Send queued output, coalescing whatever has piled up into one frame."""
+        while True:
+            chunk = await self.output_queue.get()
+            if chunk is None:
+                return
+            chunks = [chunk]
+            done = False
+            while not self.output_queue.empty():
+                chunk = self.output_queue.get_nowait()
+                if chunk is None:
+                    done = True
+                    break
+                chunks.append(chunk)
+            try:
+                await self.ws.send_bytes(b"".join(chunks))
+            except Exception as exc:
+                # The game thread re-raises this from flush_output; returning
+                # instead of raising leaves no unretrieved task exception
+                self.send_error = exc
+                # Wake a game thread blocked in sync_input so it sees the error
+                self.input_queue.put_nowait("")
+                return
+            if done:
+                return
+
+    async def close_output(self) -> None:
+        """Flush remaining output and wait until the writer has sent it.
+
+        Re-raises any error the writer hit while sending.
+        """
+        self.flush_output()
+        self.loop.call_soon_threadsafe(self.output_queue.put_nowait, None)
+        await self.writer_task
+        if self.send_error is not None:
+            raise self.send_error
 
     # ── input ─────────────────────────────────────────────────────────
 
@@ -91,6 +235,15 @@ class WebSocketBridge:
         return answer in ("y", "yes")
 
 
+@functools.lru_cache(maxsize=256)
+def _make_config(seed: int, name: str, weeks: int, capital: float) -> GameConfig:
+    """Validated GameConfig, shared between sessions with the same settings.
+
+    GameConfig is frozen, so one instance can back any number of games.
+    """
+    return GameConfig(seed=seed, player_name=name, total_weeks=weeks, starting_cash=capital)
+
+
 @app.websocket("/ws/play")
 async def play_game_ws(ws: WebSocket) -> None:
     """WebSocket endpoint: one game session per connection."""
@@ -103,10 +256,10 @@ async def play_game_ws(ws: WebSocket) -> None:
     weeks = int(params.get("weeks", "3"))
     capital = float(params.get("capital", "1000000"))
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     bridge = WebSocketBridge(ws, loop)
 
-    config = GameConfig(seed=seed, player_name=name, total_weeks=weeks, starting_cash=capital)
+    config = _make_config(seed, name, weeks, capital)
 
     async def receive_loop() -> None:
         """Receive messages from browser and feed them to the game thread."""
@@ -122,16 +275,7 @@ async def play_game_ws(ws: WebSocket) -> None:
 
     recv_task = asyncio.create_task(receive_loop())
 
-    async def keepalive_loop() -> None:
-        """Send WebSocket pings every 30s to prevent proxy idle timeouts."""
-        try:
-            while True:
-                await asyncio.sleep(30)
-                await ws.send_bytes(b"")  # empty ping frame
-        except Exception:
-            pass
-
-    keepalive_task = asyncio.create_task(keepalive_loop())
+    _start_keepalive(ws)
 
     try:
         await asyncio.to_thread(
@@ -143,7 +287,7 @@ async def play_game_ws(ws: WebSocket) -> None:
             flush_fn=bridge.flush_output,
         )
         # Final flush to ensure all output reaches the client
-        bridge.flush_output()
+        await bridge.close_output()
         await ws.send_text("\r\n\x1b[1;32mGame complete! Refresh to play again.\x1b[0m\r\n")
     except WebSocketDisconnect:
         logger.info("Client disconnected mid-game")
@@ -154,7 +298,8 @@ async def play_game_ws(ws: WebSocket) -> None:
         except Exception:
             pass
     finally:
-        keepalive_task.cancel()
+        _keepalive_sockets.discard(ws)
+        bridge.writer_task.cancel()
         recv_task.cancel()
         try:
             await recv_task
@@ -20,7 +20,7 @@ def seeded_rng() -> random.Random:
     return random.Random(42)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_macro_bull() -> MacroState:
     return MacroState(
         regime=Regime.BULL,
@@ -30,7 +30,7 @@ def sample_macro_bull() -> MacroState:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_macro_recession() -> MacroState:
     return MacroState(
         regime=Regime.RECESSION,
@@ -40,12 +40,12 @@ def sample_macro_recession() -> MacroState:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_allocation_balanced() -> Allocation:
-    return Allocation(weights={s: 20.0 for s in Sector})
+    return Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_allocation_concentrated() -> Allocation:
     return Allocation(
         weights={
@@ -60,17 +60,17 @@ def sample_allocation_concentrated() -> Allocation:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_portfolio() -> PortfolioState:
     return PortfolioState(
         cash=0.0,
-        holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+        holdings=Holdings(positions={s: 1_000_000.0 / len(Sector) for s in Sector}),
         total_value=1_000_000.0,
         week=1,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_game_config() -> GameConfig:
     return GameConfig(seed=42, starting_cash=1_000_000.0, total_weeks=26)
 
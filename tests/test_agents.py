@@ -1,7 +1,5 @@
 """Tests for risk committee agent."""
 
-import pytest
-
 from wallstreet.agents.risk_committee import RulesBasedRiskCommittee
 from wallstreet.models.enums import (
     RateDirection,
@@ -14,6 +12,10 @@ from wallstreet.models.market import MacroState
 from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
 
 
+# Holdings is frozen, so one validated instance serves every portfolio
+_EVEN_HOLDINGS = Holdings(positions={s: 1_000_000.0 / len(Sector) for s in Sector})
+
+
 def _make_game_state(
     macro: MacroState,
     portfolio: PortfolioState,
@@ -35,8 +37,9 @@ class TestRulesBasedRiskCommittee:
         self,
         sample_macro_bull: MacroState,
         sample_portfolio: PortfolioState,
+        sample_allocation_balanced: Allocation,
     ) -> None:
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
+        alloc = sample_allocation_balanced
         game = _make_game_state(sample_macro_bull, sample_portfolio)
         risk = self.agent.evaluate(alloc, sample_macro_bull, sample_portfolio, game)
         assert 1 <= risk.risk_score <= 3
@@ -65,7 +68,7 @@ class TestRulesBasedRiskCommittee:
         )
         portfolio = PortfolioState(
             cash=0.0,
-            holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+            holdings=_EVEN_HOLDINGS,
             total_value=1_000_000.0,
             week=5,
         )
@@ -89,7 +92,7 @@ class TestRulesBasedRiskCommittee:
         )
         portfolio = PortfolioState(
             cash=0.0,
-            holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+            holdings=_EVEN_HOLDINGS,
             total_value=1_000_000.0,
             week=3,
         )
@@ -113,7 +116,7 @@ class TestRulesBasedRiskCommittee:
         )
         portfolio = PortfolioState(
             cash=0.0,
-            holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+            holdings=_EVEN_HOLDINGS,
             total_value=1_000_000.0,
             week=3,
         )
@@ -138,7 +141,7 @@ class TestRulesBasedRiskCommittee:
         )
         portfolio = PortfolioState(
             cash=0.0,
-            holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+            holdings=_EVEN_HOLDINGS,
             total_value=1_000_000.0,
             week=3,
         )
@@ -162,7 +165,7 @@ class TestRulesBasedRiskCommittee:
         )
         portfolio = PortfolioState(
             cash=0.0,
-            holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+            holdings=_EVEN_HOLDINGS,
             total_value=1_000_000.0,
             week=3,
         )
@@ -1,5 +1,6 @@
 """Tests for expanded analytics module."""
 
+import numpy as np
 import pytest
 
 from wallstreet.analytics.expanded import (
@@ -7,6 +8,7 @@ from wallstreet.analytics.expanded import (
     compute_drawdown_series,
     compute_expanded_metrics,
     compute_rolling_sharpe,
+    compute_rolling_sharpe_batch,
     compute_rolling_volatility,
 )
 from wallstreet.models.enums import Sector
@@ -60,6 +62,17 @@ class TestRollingSharpe:
         result = compute_rolling_sharpe(returns)
         assert len(result) == len(returns)
 
+    def test_batch_matches_single_series(self) -> None:
+        gen = np.random.default_rng(4)
+        seasons = gen.normal(0.005, 0.04, size=(6, 26))
+        seasons[2] = 0.01  # zero-vol row
+        batch = compute_rolling_sharpe_batch(seasons)
+        assert batch.shape == seasons.shape
+        for row, season in zip(batch, seasons):
+            assert row.tolist() == pytest.approx(
+                compute_rolling_sharpe(season.tolist()), abs=1e-6
+            )
+
 
 class TestDrawdownSeries:
     def test_empty_values(self) -> None:
@@ -95,10 +108,9 @@ class TestDrawdownSeries:
 
 
 class TestConcentrationScore:
-    def test_equal_weight(self) -> None:
+    def test_equal_weight(self, sample_allocation_balanced: Allocation) -> None:
         """Equal weight across 7 sectors: HHI = 7 * (1/7)^2 ≈ 0.143."""
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        hhi = compute_concentration_score(alloc)
+        hhi = compute_concentration_score(sample_allocation_balanced)
         assert hhi == pytest.approx(1.0 / len(Sector), abs=0.001)
 
     def test_concentrated(self) -> None:
@@ -158,14 +170,11 @@ class TestConcentrationScore:
 
 
 class TestExpandedMetrics:
-    def test_integration(self) -> None:
+    def test_integration(self, sample_allocation_balanced: Allocation) -> None:
         """Full metrics computation produces valid output."""
         values = [1_000_000, 1_020_000, 990_000, 1_010_000, 1_050_000]
         returns = [0.02, -0.0294, 0.0202, 0.0396]
-        allocs = [
-            Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-            for _ in returns
-        ]
+        allocs = [sample_allocation_balanced] * len(returns)
         metrics = compute_expanded_metrics(values, returns, allocs)
 
         assert len(metrics.rolling_volatility) == len(returns)
@@ -0,0 +1,41 @@
+"""Tests for the CLI game loop."""
+
+import io
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from wallstreet.cli import app
+from wallstreet.cli.app import run_game
+from wallstreet.models.game import GameConfig
+from wallstreet.persistence.repository import GameRepository
+
+
+def _answer(prompt: str) -> str:
+    # Accept at the confirm prompt, equal 14% weights for every sector
+    return "" if "Confirm?" in prompt else "14"
+
+
+@pytest.mark.parametrize("seed", [-1, -12345])
+def test_game_with_negative_seed_completes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, seed: int
+) -> None:
+    """Negative seeds are accepted by the CLI and web entry points."""
+    db_path = str(tmp_path / "game.db")
+    monkeypatch.setattr(app, "GameRepository", lambda: GameRepository(db_path))
+    out = io.StringIO()
+    run_game(
+        GameConfig(seed=seed, total_weeks=2, player_name="Test"),
+        con=Console(file=out, width=120),
+        input_fn=_answer,
+        confirm_fn=lambda prompt: False,
+    )
+    repo = GameRepository(db_path)
+    repo.initialize()
+    games = repo.list_games()
+    repo.close()
+    assert len(games) == 1
+    assert games[0]["seed"] == seed
+    assert games[0]["is_complete"] == 1
+    assert games[0]["current_week"] == 2
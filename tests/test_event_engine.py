@@ -1,25 +1,43 @@
 """Tests for event engine: event generation and selection."""
 
 import random
+import sys
 
 import pytest
+from pydantic import ValidationError
 
 from wallstreet.models.enums import (
+    SECTOR_ORDER,
     RateDirection,
     Regime,
     Sector,
     VolatilityState,
 )
+from wallstreet.models.events import ShockEvent, ShockEventTemplate
 from wallstreet.models.market import MacroState
-from wallstreet.event_engine.generator import generate_weekly_events
+from wallstreet.event_engine.catalog import EVENT_CATALOG
+from wallstreet.event_engine.generator import (
+    EVENT_COUNT_WEIGHTS,
+    _sample_event_count,
+    generate_weekly_events,
+)
+
+
+@pytest.fixture(scope="module")
+def bull_weekly_events(sample_macro_bull: MacroState) -> list[list[ShockEvent]]:
+    """One week of events for each of seeds 0-199 in a bull market."""
+    return [
+        generate_weekly_events(sample_macro_bull, random.Random(seed))
+        for seed in range(200)
+    ]
 
 
 class TestEventGeneration:
-    def test_event_count_range(self, sample_macro_bull: MacroState) -> None:
+    def test_event_count_range(
+        self, bull_weekly_events: list[list[ShockEvent]]
+    ) -> None:
         """Always 0-2 events per week."""
-        for seed in range(200):
-            rng = random.Random(seed)
-            events = generate_weekly_events(sample_macro_bull, rng)
+        for events in bull_weekly_events:
             assert 0 <= len(events) <= 2
 
     def test_reproducible(self, sample_macro_bull: MacroState) -> None:
@@ -34,11 +52,11 @@ class TestEventGeneration:
         for e1, e2 in zip(events1, events2):
             assert e1.template_name == e2.template_name
 
-    def test_no_duplicates(self, sample_macro_bull: MacroState) -> None:
+    def test_no_duplicates(
+        self, bull_weekly_events: list[list[ShockEvent]]
+    ) -> None:
         """No duplicate event names in same week."""
-        for seed in range(200):
-            rng = random.Random(seed)
-            events = generate_weekly_events(sample_macro_bull, rng)
+        for events in bull_weekly_events:
             names = [e.template_name for e in events]
             assert len(names) == len(set(names))
 
@@ -49,6 +67,46 @@ class TestEventGeneration:
         for event in events:
             assert len(event.sector_effects) > 0
 
+    def test_events_share_template_effect_vectors(
+        self, sample_macro_bull: MacroState
+    ) -> None:
+        """Generated events reuse the catalog's prebuilt effect vectors."""
+        by_name = {tmpl.name: tmpl for tmpl in EVENT_CATALOG}
+        for seed in range(50):
+            rng = random.Random(seed)
+            for event in generate_weekly_events(sample_macro_bull, rng):
+                tmpl = by_name[event.template_name]
+                assert event.sector_effects_vec is tmpl.sector_effects_vec
+                assert event.description is tmpl.description
+
+    @pytest.mark.parametrize("vol", list(VolatilityState))
+    def test_event_count_matches_rng_choices(self, vol: VolatilityState) -> None:
+        """Event counts are drawn exactly like rng.choices([0, 1, 2], ...)."""
+        weights = EVENT_COUNT_WEIGHTS[vol]
+        for seed in range(20):
+            ours, ref = random.Random(seed), random.Random(seed)
+            # Consecutive draws keep both streams in lockstep
+            for _ in range(50):
+                expected = ref.choices([0, 1, 2], weights=weights, k=1)[0]
+                assert _sample_event_count(vol, ours) == expected
+
+    @pytest.mark.parametrize("vol", list(VolatilityState))
+    def test_event_list_follows_sampled_count(self, vol: VolatilityState) -> None:
+        """Events per period follow the count (two picks may dedupe to one)."""
+        macro = MacroState(
+            regime=Regime.BULL,
+            volatility_state=vol,
+            rate_direction=RateDirection.STABLE,
+            week=1,
+        )
+        for seed in range(200):
+            expected = _sample_event_count(vol, random.Random(seed))
+            events = generate_weekly_events(macro, random.Random(seed))
+            if expected == 2:
+                assert len(events) in (1, 2)
+            else:
+                assert len(events) == expected
+
     def test_crisis_produces_more_events(self) -> None:
         """Higher volatility should average more events."""
         low_vol = MacroState(
@@ -74,3 +132,64 @@ class TestEventGeneration:
 
         # Crisis should average significantly more events
         assert crisis_total / n > low_total / n
+
+    def test_from_template_matches_validated_event(self) -> None:
+        tmpl = EVENT_CATALOG[0]
+        event = ShockEvent.from_template(tmpl, week=3)
+        validated = ShockEvent(
+            template_name=tmpl.name,
+            description=tmpl.description,
+            sector_effects=tmpl.sector_effects,
+            vol_impact=tmpl.vol_impact,
+            week=3,
+        )
+        assert event == validated
+        assert event.model_dump_json() == validated.model_dump_json()
+        assert event.sector_effects_json == validated.sector_effects_json
+        assert event.sector_effects_json is tmpl.sector_effects_json
+
+    def test_events_cannot_change_catalog(self) -> None:
+        tmpl = EVENT_CATALOG[0]
+        effects = dict(tmpl.sector_effects)
+        vec = tmpl.sector_effects_vec.tolist()
+        event = ShockEvent.from_template(tmpl, week=3)
+        event.sector_effects[Sector.TECH] = 9.0
+        with pytest.raises(ValueError):
+            event.sector_effects_vec[0] = 9.0
+        with pytest.raises(ValidationError):
+            event.vol_impact = 9.0
+        with pytest.raises(ValidationError):
+            tmpl.sector_effects = {}
+        assert tmpl.sector_effects == effects
+        assert tmpl.sector_effects_vec.tolist() == vec
+
+    def test_template_text_is_interned(self) -> None:
+        for tmpl in EVENT_CATALOG:
+            assert tmpl.name is sys.intern(tmpl.name)
+            assert tmpl.description is sys.intern(tmpl.description)
+
+
+class TestEffectVectors:
+    def test_aligned_to_sector_order(self) -> None:
+        for tmpl in EVENT_CATALOG:
+            vec = tmpl.sector_effects_vec
+            assert vec.shape == (len(SECTOR_ORDER),)
+            for i, sector in enumerate(SECTOR_ORDER):
+                assert vec[i] == tmpl.sector_effects.get(sector, 0.0)
+
+    def test_missing_sectors_are_zero(self) -> None:
+        event = ShockEvent(
+            template_name="Partial",
+            description="test",
+            sector_effects={Sector.ENERGY: 0.04},
+            vol_impact=0.0,
+            week=1,
+        )
+        expected = [0.04 if s is Sector.ENERGY else 0.0 for s in SECTOR_ORDER]
+        assert event.sector_effects_vec.tolist() == expected
+
+    def test_constructed_template_builds_vector(self) -> None:
+        tmpl = EVENT_CATALOG[0]
+        constructed = ShockEventTemplate.model_construct(**dict(tmpl))
+        expected = tmpl.sector_effects_vec.tolist()
+        assert constructed.sector_effects_vec.tolist() == expected
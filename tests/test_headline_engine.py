@@ -1,6 +1,7 @@
 """Tests for Headline Engine."""
 
 import random
+import re
 
 import pytest
 
@@ -10,6 +11,9 @@ from wallstreet.models.events import ShockEvent
 from wallstreet.models.market import MacroState
 from wallstreet.models.narrative import Headline
 
+_OIL_RE = re.compile(r"oil|crude|energy", re.IGNORECASE)
+_CRISIS_RE = re.compile(r"panic|fear|vix|circuit|historic", re.IGNORECASE)
+
 
 class TestHeadlineEngine:
     def test_generates_headlines(self, sample_macro_bull: MacroState) -> None:
@@ -51,9 +55,8 @@ class TestHeadlineEngine:
         )
         rng = random.Random(42)
         headlines = generate_headlines(macro, [event], rng)
-        texts = [h.text.lower() for h in headlines]
         # At least one headline should mention oil or energy
-        assert any("oil" in t or "crude" in t or "energy" in t for t in texts)
+        assert any(_OIL_RE.search(h.text) for h in headlines)
 
     def test_crisis_vol_headline(self) -> None:
         """Crisis volatility should generate crisis-specific headlines."""
@@ -65,22 +68,20 @@ class TestHeadlineEngine:
         )
         rng = random.Random(42)
         headlines = generate_headlines(macro, [], rng)
-        texts = " ".join(h.text.lower() for h in headlines)
         # Should contain panic, fear, or circuit breaker related language
-        assert any(word in texts for word in ["panic", "fear", "vix", "circuit", "historic"])
+        assert any(_CRISIS_RE.search(h.text) for h in headlines)
 
-    def test_all_regimes_produce_headlines(self) -> None:
+    @pytest.mark.parametrize("regime", list(Regime))
+    def test_all_regimes_produce_headlines(self, regime: Regime) -> None:
         """Every regime produces valid headlines."""
-        for regime in Regime:
-            macro = MacroState(
-                regime=regime,
-                volatility_state=VolatilityState.NORMAL,
-                rate_direction=RateDirection.STABLE,
-                week=1,
-            )
-            rng = random.Random(42)
-            headlines = generate_headlines(macro, [], rng)
-            assert len(headlines) >= 2
+        macro = MacroState(
+            regime=regime,
+            volatility_state=VolatilityState.NORMAL,
+            rate_direction=RateDirection.STABLE,
+            week=1,
+        )
+        headlines = generate_headlines(macro, [], random.Random(42))
+        assert len(headlines) >= 2
 
     def test_reproducible(self, sample_macro_bull: MacroState) -> None:
         """Same seed produces same headlines."""
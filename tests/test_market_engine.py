@@ -1,30 +1,54 @@
 """Tests for market engine: regime transitions and return generation."""
 
+import itertools
 import random
 
+import numpy as np
 import pytest
 
 from wallstreet.models.enums import (
+    REGIME_INDEX,
+    SECTOR_ORDER,
     RateDirection,
     Regime,
     Sector,
     VolatilityState,
 )
 from wallstreet.models.market import MacroState
-from wallstreet.market_engine.regime import advance_macro_state
-from wallstreet.market_engine.returns import generate_sector_returns, apply_events
+from wallstreet.market_engine.regime import (
+    REGIME_TRANSITION,
+    _REGIME_TABLE,
+    _weighted_choice,
+    advance_macro_state,
+)
+from wallstreet.market_engine.correlation import (
+    CORRELATION_MATRICES,
+    PrecomputedNoise,
+    sample_correlated_normals,
+    sample_correlated_normals_many,
+    sample_regime_path_shocks,
+    sample_weekly_shocks_batch,
+)
+from wallstreet.market_engine.returns import (
+    RATE_MODIFIERS,
+    SECTOR_PARAMS,
+    VOL_SCALING,
+    apply_events,
+    apply_events_all_weeks,
+    apply_events_array,
+    generate_sector_returns,
+    generate_sector_returns_array,
+    simulate_all_weeks,
+    simulate_portfolio,
+)
+from wallstreet.event_engine.generator import generate_weekly_events
 from wallstreet.models.events import ShockEvent
 
 
 class TestRegimeTransition:
-    def test_reproducible(self) -> None:
+    def test_reproducible(self, sample_macro_bull: MacroState) -> None:
         """Same seed produces same regime sequence."""
-        macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.STABLE,
-            week=1,
-        )
+        macro = sample_macro_bull
         results1 = []
         rng1 = random.Random(42)
         state = macro
@@ -41,15 +65,10 @@ class TestRegimeTransition:
 
         assert results1 == results2
 
-    def test_valid_states(self) -> None:
+    def test_valid_states(self, sample_macro_bull: MacroState) -> None:
         """All transitions produce valid enum values."""
         rng = random.Random(99)
-        macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.STABLE,
-            week=1,
-        )
+        macro = sample_macro_bull
         for _ in range(100):
             macro = advance_macro_state(macro, rng)
             assert macro.regime in Regime
@@ -69,6 +88,27 @@ class TestRegimeTransition:
             new_macro = advance_macro_state(macro, rng)
             assert new_macro.regime in Regime
 
+    def test_week_override(self) -> None:
+        macro = MacroState(
+            regime=Regime.BULL,
+            volatility_state=VolatilityState.NORMAL,
+            rate_direction=RateDirection.STABLE,
+            week=3,
+        )
+        assert advance_macro_state(macro, random.Random(1)).week == 3
+        assert advance_macro_state(macro, random.Random(1), week=4).week == 4
+
+    def test_sampler_matches_rng_choices(self) -> None:
+        """Cumulative-table sampling draws exactly like rng.choices."""
+        for regime in Regime:
+            row = REGIME_TRANSITION[regime]
+            for seed in range(200):
+                expected = random.Random(seed).choices(
+                    list(row), weights=list(row.values()), k=1
+                )[0]
+                actual = _weighted_choice(_REGIME_TABLE[regime], random.Random(seed))
+                assert actual == expected
+
 
 class TestSectorReturns:
     def test_reproducible(self, sample_macro_bull: MacroState) -> None:
@@ -79,8 +119,28 @@ class TestSectorReturns:
         rng2 = random.Random(42)
         ret2 = generate_sector_returns(sample_macro_bull, rng2)
 
-        for sector in Sector:
-            assert ret1[sector] == pytest.approx(ret2[sector])
+        # Identical, not just close: one seed must give the same floats
+        assert ret1 == ret2
+
+    def test_matches_per_sector_formula(self) -> None:
+        """Vectorized returns equal mean + std * z computed sector by sector."""
+        for regime, rate, vol in itertools.product(
+            Regime, RateDirection, VolatilityState
+        ):
+            macro = MacroState(
+                regime=regime,
+                volatility_state=vol,
+                rate_direction=rate,
+                week=1,
+            )
+            ret = generate_sector_returns(macro, random.Random(11))
+            z = sample_correlated_normals(regime, random.Random(11))
+            for sector in SECTOR_ORDER:
+                mean_base, std_base = SECTOR_PARAMS[regime][sector]
+                mean_add, std_mult = RATE_MODIFIERS[rate][sector]
+                std = std_base * std_mult * VOL_SCALING[vol]
+                raw = mean_base + mean_add + std * z[sector]
+                assert ret[sector] == pytest.approx(max(-0.30, min(0.30, raw)))
 
     def test_all_sectors_present(self, sample_macro_bull: MacroState) -> None:
         rng = random.Random(42)
@@ -89,7 +149,6 @@ class TestSectorReturns:
 
     def test_returns_clamped(self) -> None:
         """Returns never exceed +/- 30%."""
-        rng = random.Random(42)
         # Use crisis volatility to push returns toward extremes
         macro = MacroState(
             regime=Regime.RECESSION,
@@ -97,16 +156,17 @@ class TestSectorReturns:
             rate_direction=RateDirection.FALLING,
             week=1,
         )
-        for i in range(100):
-            rng_iter = random.Random(i)
-            ret = generate_sector_returns(macro, rng_iter)
-            for sector, val in ret.items():
-                assert -0.30 <= val <= 0.30, f"Return out of bounds: {sector}={val}"
+        returns = np.stack([
+            generate_sector_returns_array(macro, random.Random(i))
+            for i in range(100)
+        ])
+        out_of_bounds = returns[(returns < -0.30) | (returns > 0.30)]
+        assert out_of_bounds.size == 0, f"Returns out of bounds: {out_of_bounds}"
 
 
 class TestApplyEvents:
     def test_additive(self) -> None:
-        base = {s: 0.01 for s in Sector}
+        base = {s: 0.01 for s in SECTOR_ORDER}
         event = ShockEvent(
             template_name="Test",
             description="test",
@@ -125,7 +185,7 @@ class TestApplyEvents:
         assert adjusted[Sector.CONSUMER] == pytest.approx(0.01)
 
     def test_clamping_after_events(self) -> None:
-        base = {s: 0.28 for s in Sector}
+        base = {s: 0.28 for s in SECTOR_ORDER}
         event = ShockEvent(
             template_name="Huge",
             description="test",
@@ -140,3 +200,148 @@ class TestApplyEvents:
         )
         adjusted = apply_events(base, [event])
         assert adjusted[Sector.TECH] == pytest.approx(0.30)  # clamped
+
+    def test_array_form_writes_into_out(self) -> None:
+        base = np.full(len(SECTOR_ORDER), 0.01)
+        event = ShockEvent(
+            template_name="Test",
+            description="test",
+            sector_effects={Sector.TECH: 0.05, Sector.ENERGY: -0.03},
+            vol_impact=0.0,
+            week=1,
+        )
+        expected = apply_events_array(base, [event])
+        assert base.tolist() == [0.01] * len(SECTOR_ORDER)
+
+        out = np.empty_like(base)
+        assert apply_events_array(base, [event], out=out) is out
+        assert out.tolist() == expected.tolist()
+
+        assert apply_events_array(base, [event], out=base) is base
+        assert base.tolist() == expected.tolist()
+
+
+class TestBatchedShocks:
+    def test_batch_shape_and_correlation(self) -> None:
+        gen = np.random.default_rng(7)
+        shocks = sample_weekly_shocks_batch(Regime.BEAR, 20_000, gen)
+        assert shocks.shape == (20_000, len(Sector))
+        empirical = np.corrcoef(shocks, rowvar=False)
+        expected = np.array(CORRELATION_MATRICES[Regime.BEAR])
+        assert np.allclose(empirical, expected, atol=0.03)
+
+    def test_regime_path_reproducible(self) -> None:
+        path = [Regime.BULL, Regime.BULL, Regime.BEAR, Regime.BULL, Regime.RECESSION]
+        a = sample_regime_path_shocks(path, np.random.default_rng(1))
+        b = sample_regime_path_shocks(path, np.random.default_rng(1))
+        assert a.shape == (len(path), len(Sector))
+        assert np.array_equal(a, b)
+
+    def test_many_simulations_use_each_regime_correlation(self) -> None:
+        gen = np.random.default_rng(3)
+        n = 20_000
+        for regime in (Regime.BULL, Regime.RECESSION):
+            idx = np.full(n, REGIME_INDEX[regime])
+            shocks = sample_correlated_normals_many(idx, gen)
+            assert shocks.shape == (n, len(Sector))
+            empirical = np.corrcoef(shocks, rowvar=False)
+            expected = np.array(CORRELATION_MATRICES[regime])
+            assert np.allclose(empirical, expected, atol=0.03)
+
+
+class TestPrecomputedNoise:
+    def test_reproducible_per_seed(self) -> None:
+        a = PrecomputedNoise(seed=5, total_weeks=26)
+        b = PrecomputedNoise(seed=5, total_weeks=26)
+        for week in (0, 1, 26):
+            assert np.array_equal(a.row(Regime.BEAR, week), b.row(Regime.BEAR, week))
+
+    def test_negative_seed(self) -> None:
+        # Any int is a valid game seed, as it is for random.Random
+        a = PrecomputedNoise(seed=-1, total_weeks=26)
+        b = PrecomputedNoise(seed=-1, total_weeks=26)
+        assert np.array_equal(a.row(Regime.BULL, 1), b.row(Regime.BULL, 1))
+        other = PrecomputedNoise(seed=1, total_weeks=26)
+        assert not np.array_equal(a.row(Regime.BULL, 1), other.row(Regime.BULL, 1))
+
+    def test_rows_correlated_per_regime(self) -> None:
+        noise = PrecomputedNoise(seed=8, total_weeks=20_000)
+        for regime in (Regime.BULL, Regime.BEAR):
+            rows = np.array([noise.row(regime, w) for w in range(20_001)])
+            empirical = np.corrcoef(rows, rowvar=False)
+            expected = np.array(CORRELATION_MATRICES[regime])
+            assert np.allclose(empirical, expected, atol=0.03)
+
+    def test_returns_use_noise_without_touching_rng(
+        self, sample_macro_bull: MacroState
+    ) -> None:
+        noise = PrecomputedNoise(seed=1, total_weeks=26)
+        rng = random.Random(42)
+        state = rng.getstate()
+        ret1 = generate_sector_returns(sample_macro_bull, rng, noise)
+        assert rng.getstate() == state
+        ret2 = generate_sector_returns(sample_macro_bull, random.Random(0), noise)
+        assert ret1 == ret2
+
+
+class TestSimulateAllWeeks:
+    def test_matches_per_week_generation(self) -> None:
+        rng = random.Random(3)
+        macro = MacroState(
+            regime=Regime.BULL,
+            volatility_state=VolatilityState.NORMAL,
+            rate_direction=RateDirection.STABLE,
+            week=0,
+        )
+        schedule = []
+        for week in range(1, 27):
+            nxt = advance_macro_state(macro, rng)
+            macro = MacroState(
+                regime=nxt.regime,
+                volatility_state=nxt.volatility_state,
+                rate_direction=nxt.rate_direction,
+                week=week,
+            )
+            schedule.append(macro)
+
+        noise = PrecomputedNoise(seed=3, total_weeks=26)
+        z = np.array([noise.row(m.regime, m.week) for m in schedule])
+        matrix = simulate_all_weeks(schedule, z)
+
+        assert matrix.shape == (26, len(Sector))
+        for row, m in zip(matrix, schedule):
+            expected = generate_sector_returns(m, random.Random(0), noise)
+            assert row.tolist() == [expected[s] for s in SECTOR_ORDER]
+
+    def test_season_events_match_per_week_application(self) -> None:
+        rng = random.Random(8)
+        gen = np.random.default_rng(8)
+        returns = gen.normal(0.0, 0.1, size=(26, len(SECTOR_ORDER)))
+        events_by_week = []
+        for week in range(1, 27):
+            macro = MacroState(
+                regime=Regime.RECESSION,
+                volatility_state=VolatilityState.CRISIS,
+                rate_direction=RateDirection.FALLING,
+                week=week,
+            )
+            events_by_week.append(generate_weekly_events(macro, rng))
+        assert any(len(events) == 2 for events in events_by_week)
+
+        adjusted = apply_events_all_weeks(returns, events_by_week)
+        for row, base, events in zip(adjusted, returns, events_by_week):
+            assert row == pytest.approx(apply_events_array(base, events))
+
+    def test_portfolio_rollout_matches_weekly_loop(self) -> None:
+        gen = np.random.default_rng(5)
+        returns = gen.normal(0.0, 0.1, size=(26, len(SECTOR_ORDER)))
+        returns[20] = -0.80  # -120% on 150% gross long: wiped out
+        weights = np.array([0.5, 0.3, 0.2, 0.2, 0.1, 0.1, 0.1])
+
+        values = simulate_portfolio(weights, returns, 1_000_000.0)
+
+        expected = [1_000_000.0]
+        for row in returns:
+            expected.append(max(0.0, expected[-1] * (1 + float(weights @ row))))
+        assert values.tolist() == pytest.approx(expected)
+        assert values[-1] == 0.0
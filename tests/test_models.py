@@ -1,17 +1,32 @@
 """Tests for Pydantic model validation."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
-from wallstreet.models.enums import Sector
+from wallstreet.models.enums import (
+    SECTOR_ORDER,
+    RateDirection,
+    Regime,
+    Sector,
+    VolatilityState,
+)
+from wallstreet.models.events import ShockEvent
+from wallstreet.models.game import WeekResult
+from wallstreet.models.market import MacroState, SectorReturns
 from wallstreet.models.portfolio import Allocation
 from wallstreet.models.scoring import ScoreCard
 
 
+@pytest.fixture(scope="module")
+def balanced_alloc() -> Allocation:
+    # Allocation is frozen, so the tests can share one instance
+    return Allocation(weights={s: 100.0 / len(Sector) for s in SECTOR_ORDER})
+
+
 class TestAllocation:
-    def test_valid_balanced(self) -> None:
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        assert sum(alloc.weights.values()) == pytest.approx(100.0, abs=0.1)
+    def test_valid_balanced(self, balanced_alloc: Allocation) -> None:
+        assert balanced_alloc.net_exposure == pytest.approx(1.0, abs=1e-3)
 
     def test_valid_concentrated(self) -> None:
         weights = {
@@ -35,36 +50,57 @@ class TestAllocation:
 
     def test_partial_allocation_valid(self) -> None:
         """Weights summing to less than 100% are valid (remainder = cash)."""
-        weights = {s: 7.0 for s in Sector}  # sums to 49
+        weights = {s: 7.0 for s in SECTOR_ORDER}  # sums to 49
         alloc = Allocation(weights=weights)
+        assert alloc.net_exposure == pytest.approx(0.49)
         assert alloc.cash_weight == pytest.approx(0.51)
 
     def test_zero_allocation_valid(self) -> None:
         """All-cash allocation (sum=0) is valid."""
-        weights = {s: 0.0 for s in Sector}
+        weights = {s: 0.0 for s in SECTOR_ORDER}
         alloc = Allocation(weights=weights)
         assert alloc.cash_weight == pytest.approx(1.0)
 
-    def test_over_100_rejected(self) -> None:
-        weights = {s: 15.0 for s in Sector}  # sums to 105
-        with pytest.raises(ValidationError, match="sum to 0-100%"):
+    @pytest.mark.parametrize(
+        "weights,match",
+        [
+            ({s: 15.0 for s in SECTOR_ORDER}, "sum to 0-100%"),  # sums to 105
+            ({  # net allocation below 0%: sums to -10
+                Sector.TECH: 10.0, Sector.ENERGY: 0.0,
+                Sector.FINANCIALS: 0.0, Sector.CONSUMER: 0.0,
+                Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: -20.0,
+                Sector.HEALTHCARE: 0.0,
+            }, "sum to 0-100%"),
+            ({  # short exceeding -50%
+                Sector.TECH: 60.0, Sector.ENERGY: 50.0,
+                Sector.FINANCIALS: 20.0, Sector.CONSUMER: 10.0,
+                Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: -60.0,
+                Sector.HEALTHCARE: 0.0,
+            }, "Short position too large"),
+            ({  # gross 300% over the 200% cap, net 100%, no short past -50%
+                Sector.TECH: 100.0, Sector.ENERGY: 50.0,
+                Sector.FINANCIALS: 50.0, Sector.CONSUMER: 0.0,
+                Sector.CONSUMER_DISC: -50.0, Sector.INDUSTRIALS: -50.0,
+                Sector.HEALTHCARE: 0.0,
+            }, "Gross exposure"),
+            (
+                {s: 10.0 for s in SECTOR_ORDER if s is not Sector.HEALTHCARE},
+                "all 7 sectors",
+            ),
+        ],
+        ids=[
+            "over_100", "negative_net", "short_too_large", "gross_over_200",
+            "missing_sector",
+        ],
+    )
+    def test_allocation_rejected(
+        self, weights: dict[Sector, float], match: str
+    ) -> None:
+        with pytest.raises(ValidationError, match=match):
             Allocation(weights=weights)
 
-    def test_negative_net_rejected(self) -> None:
-        """Net allocation below 0% is rejected."""
-        weights = {
-            Sector.TECH: 10.0, Sector.ENERGY: 0.0,
-            Sector.FINANCIALS: 0.0, Sector.CONSUMER: 0.0,
-            Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: -20.0,
-            Sector.HEALTHCARE: 0.0,
-        }
-        # sum = -10
-        with pytest.raises(ValidationError, match="sum to 0-100%"):
-            Allocation(weights=weights)
-
-    def test_cash_weight_fully_invested(self) -> None:
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        assert alloc.cash_weight == pytest.approx(0.0, abs=0.01)
+    def test_cash_weight_fully_invested(self, balanced_alloc: Allocation) -> None:
+        assert balanced_alloc.cash_weight == pytest.approx(0.0, abs=0.01)
 
     def test_valid_with_shorts(self) -> None:
         """Negative weights are allowed (short positions)."""
@@ -77,21 +113,22 @@ class TestAllocation:
         alloc = Allocation(weights=weights)
         assert alloc.weights[Sector.INDUSTRIALS] == -5.0
         assert alloc.has_shorts is True
+        assert alloc.short_sectors == (Sector.INDUSTRIALS,)
         assert alloc.gross_exposure == pytest.approx(1.10)
 
-    def test_short_too_large_rejected(self) -> None:
-        """Short position exceeding -50% is rejected."""
-        weights = {
-            Sector.TECH: 60.0, Sector.ENERGY: 50.0,
-            Sector.FINANCIALS: 20.0, Sector.CONSUMER: 10.0,
-            Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: -60.0,
-            Sector.HEALTHCARE: 0.0,
-        }
-        with pytest.raises(ValidationError, match="Short position too large"):
+    def test_first_short_reported_before_gross(self) -> None:
+        weights = {s: 0.0 for s in SECTOR_ORDER}
+        weights[Sector.TECH] = 100.0
+        weights[Sector.ENERGY] = -55.0
+        weights[Sector.HEALTHCARE] = 55.0
+        weights[Sector.CONSUMER] = -60.0
+        weights[Sector.FINANCIALS] = 60.0
+        # gross is 330% too, but the first oversized short wins
+        with pytest.raises(ValidationError, match="Energy: -55.0%"):
             Allocation(weights=weights)
 
     def test_gross_exposure_limit(self) -> None:
-        """Gross exposure exceeding 200% is rejected."""
+        """Gross exposure under the 200% cap is accepted and reported."""
         weights = {
             Sector.TECH: 80.0, Sector.ENERGY: 20.0,
             Sector.FINANCIALS: 10.0, Sector.CONSUMER: 10.0,
@@ -102,38 +139,120 @@ class TestAllocation:
         alloc = Allocation(weights=weights)
         assert alloc.gross_exposure == pytest.approx(1.60)
 
-    def test_has_shorts_false_for_long_only(self) -> None:
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        assert alloc.has_shorts is False
+    def test_has_shorts_false_for_long_only(self, balanced_alloc: Allocation) -> None:
+        assert balanced_alloc.has_shorts is False
+        assert balanced_alloc.short_sectors == ()
 
-    def test_as_fractions(self) -> None:
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        fracs = alloc.as_fractions
-        for sector in Sector:
+    def test_as_fractions(self, balanced_alloc: Allocation) -> None:
+        fracs = balanced_alloc.as_fractions
+        for sector in SECTOR_ORDER:
             assert fracs[sector] == pytest.approx(1.0 / len(Sector))
 
+    def test_as_vector_matches_fractions(self) -> None:
+        weights = {s: 10.0 for s in SECTOR_ORDER}
+        weights[Sector.TECH] = 30.0
+        weights[Sector.ENERGY] = -10.0
+        alloc = Allocation(weights=weights)
+        fracs = alloc.as_fractions
+        assert alloc.as_vector.tolist() == [fracs[s] for s in SECTOR_ORDER]
 
-class TestScoreCard:
-    def test_letter_grade_a_plus(self) -> None:
-        sc = ScoreCard(
-            initial_value=1e6, final_value=1.5e6,
-            total_return_pct=50.0, cagr=1.0, max_drawdown=-0.05,
-            annualized_volatility=0.15, sharpe_ratio=3.5, total_weeks=26,
-        )
-        assert sc.letter_grade == "A+"
+    def test_as_vector_is_read_only(self, balanced_alloc: Allocation) -> None:
+        with pytest.raises(ValueError):
+            balanced_alloc.as_vector[0] = 1.0
+
+    def test_equality_ignores_cached_vector(self) -> None:
+        weights = {s: 100.0 / len(Sector) for s in SECTOR_ORDER}
+        a, b, c = (Allocation(weights=weights) for _ in range(3))
+        a.as_vector
+        b.as_vector
+        assert a == b
+        assert a == c
+        assert a != Allocation(weights={**weights, Sector.TECH: 0.0})
+
+    def test_derived_properties_without_validation(self) -> None:
+        weights = {s: 10.0 for s in SECTOR_ORDER}
+        weights[Sector.ENERGY] = -10.0
+        validated = Allocation(weights=weights)
+        constructed = Allocation.model_construct(weights=weights)
+        assert constructed.net_exposure == validated.net_exposure
+        assert constructed.gross_exposure == validated.gross_exposure
+        assert constructed.cash_weight == validated.cash_weight
+        assert constructed.has_shorts is validated.has_shorts is True
+        assert constructed.as_fractions == validated.as_fractions
+        assert validated.as_fractions is validated.as_fractions
 
-    def test_letter_grade_f(self) -> None:
-        sc = ScoreCard(
-            initial_value=1e6, final_value=0.5e6,
-            total_return_pct=-50.0, cagr=-0.5, max_drawdown=-0.50,
-            annualized_volatility=0.40, sharpe_ratio=-1.0, total_weeks=26,
-        )
-        assert sc.letter_grade == "F"
 
-    def test_letter_grade_b(self) -> None:
-        sc = ScoreCard(
-            initial_value=1e6, final_value=1.2e6,
-            total_return_pct=20.0, cagr=0.4, max_drawdown=-0.10,
-            annualized_volatility=0.20, sharpe_ratio=1.8, total_weeks=26,
+class TestSectorReturns:
+    def test_from_array_matches_validated(self) -> None:
+        arr = np.linspace(-0.05, 0.05, len(SECTOR_ORDER))
+        wrapped = SectorReturns.from_array(arr)
+        validated = SectorReturns(returns=dict(zip(SECTOR_ORDER, arr.tolist())))
+        assert wrapped == validated
+        assert wrapped.model_dump_json() == validated.model_dump_json()
+        assert validated.as_array.tolist() == arr.tolist()
+
+    def test_from_array_detaches_from_caller(self) -> None:
+        arr = np.zeros(len(SECTOR_ORDER))
+        wrapped = SectorReturns.from_array(arr)
+        arr += 0.05
+        assert wrapped.as_array.tolist() == [0.0] * len(SECTOR_ORDER)
+        assert wrapped == SectorReturns.from_array(wrapped.as_array.copy())
+        with pytest.raises(ValueError):
+            wrapped.as_array[0] = 1.0
+
+
+class TestWeekResult:
+    def test_construct_matches_validated(self) -> None:
+        base = np.linspace(-0.05, 0.05, len(SECTOR_ORDER))
+        fields = dict(
+            week=3,
+            macro_state=MacroState(
+                regime=Regime.BEAR,
+                volatility_state=VolatilityState.HIGH,
+                rate_direction=RateDirection.RISING,
+                week=3,
+            ),
+            allocation=Allocation(weights={s: 100.0 / len(Sector) for s in SECTOR_ORDER}),
+            sector_returns=SectorReturns.from_array(base),
+            events=[
+                ShockEvent(
+                    template_name="Test",
+                    description="test",
+                    sector_effects={Sector.TECH: -0.02},
+                    vol_impact=0.1,
+                    week=3,
+                )
+            ],
+            adjusted_returns=SectorReturns.from_array(base - 0.01),
+            portfolio_return=-0.004,
+            portfolio_value_before=1_000_000.0,
+            portfolio_value_after=996_000.0,
         )
-        assert sc.letter_grade == "B"
+        constructed = WeekResult.model_construct(**fields)
+        validated = WeekResult(**fields)
+        assert constructed == validated
+        assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+class TestScoreCard:
+    @pytest.mark.parametrize(
+        "fields,grade",
+        [
+            (dict(
+                final_value=1.5e6, total_return_pct=50.0, cagr=1.0,
+                max_drawdown=-0.05, annualized_volatility=0.15, sharpe_ratio=3.5,
+            ), "A+"),
+            (dict(
+                final_value=1.2e6, total_return_pct=20.0, cagr=0.4,
+                max_drawdown=-0.10, annualized_volatility=0.20, sharpe_ratio=1.8,
+            ), "B"),
+            (dict(
+                final_value=0.5e6, total_return_pct=-50.0, cagr=-0.5,
+                max_drawdown=-0.50, annualized_volatility=0.40, sharpe_ratio=-1.0,
+            ), "F"),
+        ],
+        ids=["a_plus", "b", "f"],
+    )
+    def test_letter_grade(self, fields: dict[str, float], grade: str) -> None:
+        sc = ScoreCard(initial_value=1e6, total_weeks=26, **fields)
+        assert sc.letter_grade == grade
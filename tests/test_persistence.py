@@ -1,5 +1,7 @@
 """Tests for SQLite persistence round-trips."""
 
+import json
+
 import pytest
 
 from wallstreet.agents.base import RiskAssessment
@@ -16,6 +18,20 @@ from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
 from wallstreet.models.scoring import ScoreCard
 from wallstreet.persistence.repository import GameRepository
 
+# Only read by save_week, so one validated event serves every test
+_TEST_EVENT = ShockEvent(
+    template_name="Test Event",
+    description="A test event occurred.",
+    sector_effects={
+        Sector.TECH: 0.02, Sector.ENERGY: -0.01,
+        Sector.FINANCIALS: 0.0, Sector.CONSUMER: 0.0,
+        Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: 0.0,
+        Sector.HEALTHCARE: 0.0,
+    },
+    vol_impact=0.1,
+    week=1,
+)
+
 
 @pytest.fixture
 def repo() -> GameRepository:
@@ -59,18 +75,6 @@ def sample_week_result() -> WeekResult:
     )
     alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
     returns = SectorReturns(returns={s: 0.01 for s in Sector})
-    event = ShockEvent(
-        template_name="Test Event",
-        description="A test event occurred.",
-        sector_effects={
-            Sector.TECH: 0.02, Sector.ENERGY: -0.01,
-            Sector.FINANCIALS: 0.0, Sector.CONSUMER: 0.0,
-            Sector.CONSUMER_DISC: 0.0, Sector.INDUSTRIALS: 0.0,
-            Sector.HEALTHCARE: 0.0,
-        },
-        vol_impact=0.1,
-        week=1,
-    )
     adjusted = SectorReturns(returns={
         Sector.TECH: 0.03, Sector.ENERGY: 0.00,
         Sector.FINANCIALS: 0.01, Sector.CONSUMER: 0.01,
@@ -82,7 +86,7 @@ def sample_week_result() -> WeekResult:
         macro_state=macro,
         allocation=alloc,
         sector_returns=returns,
-        events=[event],
+        events=[_TEST_EVENT],
         adjusted_returns=adjusted,
         portfolio_return=0.012,
         portfolio_value_before=1_000_000.0,
@@ -97,6 +101,23 @@ class TestGameRepository:
         assert len(games) >= 1
         assert any(g["game_id"] == sample_game.game_id for g in games)
 
+    def test_resave_updates_progress(
+        self, repo: GameRepository, sample_game: GameState
+    ) -> None:
+        repo.save_game(sample_game)
+        sample_game.current_week = 5
+        repo.save_game(sample_game)
+        game = next(
+            g for g in repo.list_games() if g["game_id"] == sample_game.game_id
+        )
+        assert game["current_week"] == 5
+
+        # A row removed behind the repository's back is inserted again
+        conn = repo._ensure_conn()
+        conn.execute("DELETE FROM games WHERE game_id = ?", (sample_game.game_id,))
+        repo.save_game(sample_game)
+        assert any(g["game_id"] == sample_game.game_id for g in repo.list_games())
+
     def test_save_week(
         self,
         repo: GameRepository,
@@ -110,11 +131,12 @@ class TestGameRepository:
         # Verify by querying directly
         conn = repo._ensure_conn()
         row = conn.execute(
-            "SELECT * FROM weekly_snapshots WHERE game_id = ? AND week = ?",
+            "SELECT risk_score FROM weekly_snapshots WHERE game_id = ? AND week = ?",
             (sample_game.game_id, 1),
         ).fetchone()
         assert row is not None
-        assert row["risk_score"] == 3
+        (risk_score,) = row
+        assert risk_score == 3
 
     def test_save_scorecard(
         self, repo: GameRepository, sample_game: GameState,
@@ -144,8 +166,33 @@ class TestGameRepository:
 
         conn = repo._ensure_conn()
         rows = conn.execute(
-            "SELECT * FROM events_log WHERE game_id = ?",
+            "SELECT event_name, sector_effects_json FROM events_log WHERE game_id = ?",
             (sample_game.game_id,),
         ).fetchall()
         assert len(rows) == 1
-        assert rows[0]["event_name"] == "Test Event"
+        event_name, effects_json = rows[0]
+        assert event_name == "Test Event"
+        effects = json.loads(effects_json)
+        assert effects["Tech"] == pytest.approx(0.02)
+        assert effects["Energy"] == pytest.approx(-0.01)
+
+    def test_deferred_commit_and_flush(
+        self,
+        repo: GameRepository,
+        sample_game: GameState,
+        sample_week_result: WeekResult,
+    ) -> None:
+        repo.save_game(sample_game)
+        repo.save_week(
+            sample_game.game_id, sample_week_result, None, commit=False
+        )
+
+        conn = repo._ensure_conn()
+        assert conn.in_transaction
+        repo.flush()
+        assert not conn.in_transaction
+        count = conn.execute(
+            "SELECT COUNT(*) FROM weekly_snapshots WHERE game_id = ?",
+            (sample_game.game_id,),
+        ).fetchone()[0]
+        assert count == 1
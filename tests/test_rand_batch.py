@@ -0,0 +1,37 @@
+"""Tests for the batched RNG shared by the narrative agents."""
+
+import random
+
+from wallstreet.agents.fed_agent import FedChairAgent
+from wallstreet.agents.rand_batch import RandBatch
+from wallstreet.models.market import MacroState
+
+
+class TestRandBatch:
+    def test_serves_source_draws_in_order(self) -> None:
+        source = random.Random(5)
+        expected = [source.random() for _ in range(6)]
+        batch = RandBatch(random.Random(5), 3)
+        assert [batch.random() for _ in range(6)] == expected
+
+    def test_consumes_fixed_block_from_source(self) -> None:
+        rng = random.Random(9)
+        batch = RandBatch(rng, 8)
+        batch.random()
+        reference = random.Random(9)
+        for _ in range(8):
+            reference.random()
+        assert rng.random() == reference.random()
+
+    def test_ranges(self) -> None:
+        batch = RandBatch(random.Random(1), 16)
+        for _ in range(500):
+            assert 2 <= batch.randint(2, 4) <= 4
+            assert -3.0 <= batch.uniform(-3, 3) <= 3.0
+            assert batch.choice("abc") in "abc"
+
+    def test_agents_accept_batch(self, sample_macro_bull: MacroState) -> None:
+        fed = FedChairAgent()
+        s1 = fed.generate(sample_macro_bull, RandBatch(random.Random(42), 8))
+        s2 = fed.generate(sample_macro_bull, RandBatch(random.Random(42), 8))
+        assert s1 == s2
@@ -2,6 +2,7 @@
 
 import random
 
+import numpy as np
 import pytest
 
 from wallstreet.agents.rival_pm import (
@@ -13,28 +14,43 @@ from wallstreet.agents.rival_pm import (
     VALUE,
     RivalPM,
 )
-from wallstreet.models.enums import RateDirection, Regime, Sector, VolatilityState
+from wallstreet.layers.competition import GameCompetitionLayer
+from wallstreet.models.enums import (
+    SECTOR_ORDER,
+    RateDirection,
+    Regime,
+    Sector,
+    VolatilityState,
+)
 from wallstreet.models.game import GameConfig, GameState, WeekResult
 from wallstreet.models.market import MacroState, SectorReturns
 from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
 
 
+# Frozen models, validated once and shared by every game state built below
+_EVEN_HOLDINGS = Holdings(positions={s: 1_000_000.0 / len(Sector) for s in Sector})
+_CONFIG = GameConfig(seed=42, starting_cash=1_000_000.0, total_weeks=26)
+_EVEN_ALLOCATION = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
+# GameState validation copies the list it is given, so one can be shared
+_NO_HISTORY: list[WeekResult] = []
+
+
 def _make_game_state(
     macro: MacroState,
     history: list[WeekResult] | None = None,
 ) -> GameState:
     portfolio = PortfolioState(
         cash=0.0,
-        holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+        holdings=_EVEN_HOLDINGS,
         total_value=1_000_000.0,
         week=macro.week,
     )
     return GameState(
-        config=GameConfig(seed=42, starting_cash=1_000_000.0, total_weeks=26),
+        config=_CONFIG,
         macro_state=macro,
         portfolio=portfolio,
         weekly_values=[1_000_000.0],
-        history=history or [],
+        history=history or _NO_HISTORY,
     )
 
 
@@ -45,14 +61,16 @@ def _make_week_result(week: int, returns: dict[Sector, float]) -> WeekResult:
         rate_direction=RateDirection.STABLE,
         week=week,
     )
-    alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
+    # No events, so adjusted returns equal raw returns; SectorReturns is
+    # frozen and one instance serves both
+    sector_returns = SectorReturns(returns=returns)
     return WeekResult(
         week=week,
         macro_state=macro,
-        allocation=alloc,
-        sector_returns=SectorReturns(returns=returns),
+        allocation=_EVEN_ALLOCATION,
+        sector_returns=sector_returns,
         events=[],
-        adjusted_returns=SectorReturns(returns=returns),
+        adjusted_returns=sector_returns,
         portfolio_return=sum(returns.values()) / len(returns),
         portfolio_value_before=1_000_000.0,
         portfolio_value_after=1_000_000.0,
@@ -71,26 +89,23 @@ class TestRivalPMAllStrategies:
         with pytest.raises(ValueError):
             RivalPM("unknown_strategy")
 
-    def test_each_strategy_produces_allocation(self) -> None:
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    def test_each_strategy_produces_allocation(
+        self, strategy: str, sample_macro_bull: MacroState
+    ) -> None:
         """Every strategy returns a valid Allocation."""
-        macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.STABLE,
-            week=1,
-        )
+        macro = sample_macro_bull
         game = _make_game_state(macro)
-        for strategy in ALL_STRATEGIES:
-            rival = RivalPM(strategy)
-            alloc = rival.decide(macro, game, random.Random(42))
-            assert isinstance(alloc, Allocation)
-            # Sum to 100
-            total = sum(alloc.weights.values())
-            assert abs(total - 100.0) < 0.1
-            # All sectors present
-            assert set(alloc.weights.keys()) == set(Sector)
-
-    def test_all_sectors_covered(self) -> None:
+        rival = RivalPM(strategy)
+        alloc = rival.decide(macro, game, random.Random(42))
+        assert isinstance(alloc, Allocation)
+        # Fully invested
+        assert abs(alloc.net_exposure - 1.0) < 1e-3
+        # All sectors present
+        assert alloc.weights.keys() == set(SECTOR_ORDER)
+
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    def test_all_sectors_covered(self, strategy: str) -> None:
         """Each strategy allocates to all 7 sectors."""
         macro = MacroState(
             regime=Regime.BEAR,
@@ -99,41 +114,35 @@ class TestRivalPMAllStrategies:
             week=5,
         )
         game = _make_game_state(macro)
-        for strategy in ALL_STRATEGIES:
-            rival = RivalPM(strategy)
-            alloc = rival.decide(macro, game, random.Random(42))
-            for sector in Sector:
-                assert alloc.weights[sector] > 0
+        rival = RivalPM(strategy)
+        alloc = rival.decide(macro, game, random.Random(42))
+        for sector in SECTOR_ORDER:
+            assert alloc.weights[sector] > 0
 
-    def test_names_assigned(self) -> None:
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    def test_names_assigned(self, strategy: str) -> None:
         """Each strategy has a unique rival name."""
-        for strategy in ALL_STRATEGIES:
-            rival = RivalPM(strategy)
-            assert rival.name == RIVAL_NAMES[strategy]
-            assert len(rival.name) > 0
+        rival = RivalPM(strategy)
+        assert rival.name == RIVAL_NAMES[strategy]
+        assert len(rival.name) > 0
 
-    def test_reproducible(self) -> None:
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    def test_reproducible(self, strategy: str, sample_macro_bull: MacroState) -> None:
         """Same seed produces same allocation."""
-        macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.STABLE,
-            week=1,
-        )
+        macro = sample_macro_bull
         game = _make_game_state(macro)
-        for strategy in ALL_STRATEGIES:
-            rival = RivalPM(strategy)
-            a1 = rival.decide(macro, game, random.Random(42))
-            a2 = rival.decide(macro, game, random.Random(42))
-            for sector in Sector:
-                assert abs(a1.weights[sector] - a2.weights[sector]) < 0.01
+        rival = RivalPM(strategy)
+        a1 = rival.decide(macro, game, random.Random(42))
+        a2 = rival.decide(macro, game, random.Random(42))
+        for sector in SECTOR_ORDER:
+            assert abs(a1.weights[sector] - a2.weights[sector]) < 0.01
 
 
 class TestMomentumStrategy:
     def test_overweights_winners(self) -> None:
         """Momentum strategy should overweight sectors with positive trailing returns."""
         # Create history where Tech outperformed
-        returns_week1 = {s: 0.01 for s in Sector}
+        returns_week1 = {s: 0.01 for s in SECTOR_ORDER}
         returns_week1[Sector.TECH] = 0.05
         returns_week2 = dict(returns_week1)
 
@@ -157,7 +166,7 @@ class TestMomentumStrategy:
 class TestValueStrategy:
     def test_overweights_losers(self) -> None:
         """Value strategy should overweight sectors with negative trailing returns."""
-        returns_week1 = {s: 0.01 for s in Sector}
+        returns_week1 = {s: 0.01 for s in SECTOR_ORDER}
         returns_week1[Sector.ENERGY] = -0.05
 
         history = [
@@ -178,16 +187,29 @@ class TestValueStrategy:
 
 
 class TestMacroTimerStrategy:
-    def test_recession_overweights_consumer(self) -> None:
+    def test_recession_overweights_consumer(
+        self, sample_macro_recession: MacroState
+    ) -> None:
         """Macro timer in recession should overweight Consumer."""
-        macro = MacroState(
-            regime=Regime.RECESSION,
-            volatility_state=VolatilityState.HIGH,
-            rate_direction=RateDirection.FALLING,
-            week=5,
-        )
+        macro = sample_macro_recession
         game = _make_game_state(macro)
         rival = RivalPM(MACRO_TIMER)
         alloc = rival.decide(macro, game, random.Random(42))
         # Consumer should be the largest allocation in recession
         assert alloc.weights[Sector.CONSUMER] == max(alloc.weights.values())
+
+
+class TestCompetitionLayer:
+    def test_value_log_tracks_each_week(self, sample_macro_bull: MacroState) -> None:
+        macro = sample_macro_bull
+        game = _make_game_state(macro)
+        layer = GameCompetitionLayer(MOMENTUM, total_weeks=2)
+        returns = np.full(len(SECTOR_ORDER), 0.01)
+        rng = random.Random(42)
+        for _ in range(3):  # one week past the preallocated season
+            result = layer.process_week(macro, returns, game, rng)
+            assert result.portfolio_return == pytest.approx(0.01)
+        assert len(layer.rival_values) == 4
+        assert layer.rival_values[0] == 1_000_000.0
+        assert layer.rival_values[-1] == pytest.approx(1_000_000.0 * 1.01 ** 3)
+        assert layer.rival_values[-1] == layer.rival_value
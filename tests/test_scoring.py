@@ -2,16 +2,24 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from wallstreet.scoring.calculator import (
     compute_annualized_volatility,
     compute_cagr,
     compute_max_drawdown,
+    compute_max_drawdown_arr,
+    compute_period_returns,
     compute_scorecard,
     compute_sharpe_ratio,
 )
 
+# Series shared by more than one test; tuples, since the calculators take
+# any Sequence and nothing may mutate them
+_DEEP_DRAWDOWN_VALUES = (1000, 1200, 800, 600, 900)
+_FLAT_RETURNS = (0.01,) * 10
+
 
 class TestCAGR:
     def test_doubling_in_26_months(self) -> None:
@@ -52,16 +60,22 @@ class TestMaxDrawdown:
         assert compute_max_drawdown([100]) == 0.0
 
     def test_deep_drawdown(self) -> None:
-        values = [1000, 1200, 800, 600, 900]
         # Peak = 1200, trough = 600, dd = -600/1200 = -0.50
-        dd = compute_max_drawdown(values)
+        dd = compute_max_drawdown(_DEEP_DRAWDOWN_VALUES)
         assert dd == pytest.approx(-0.50)
 
+    def test_array_entry_point_matches(self) -> None:
+        arr = np.array(_DEEP_DRAWDOWN_VALUES, dtype=np.float64)
+        assert compute_max_drawdown_arr(arr) == compute_max_drawdown(
+            _DEEP_DRAWDOWN_VALUES
+        )
+        # The caller's array is not modified
+        assert tuple(arr.tolist()) == _DEEP_DRAWDOWN_VALUES
+
 
 class TestAnnualizedVolatility:
     def test_constant_returns(self) -> None:
-        returns = [0.01] * 10
-        vol = compute_annualized_volatility(returns)
+        vol = compute_annualized_volatility(_FLAT_RETURNS)
         assert vol == pytest.approx(0.0, abs=1e-10)
 
     def test_known_value(self) -> None:
@@ -89,11 +103,19 @@ class TestSharpeRatio:
         assert sharpe < 0
 
     def test_zero_vol(self) -> None:
-        returns = [0.01] * 10
-        sharpe = compute_sharpe_ratio(returns)
+        sharpe = compute_sharpe_ratio(_FLAT_RETURNS)
         assert sharpe == 0.0
 
 
+class TestPeriodReturns:
+    def test_simple_returns(self) -> None:
+        returns = compute_period_returns([100, 110, 99])
+        assert returns == pytest.approx([0.10, -0.10])
+
+    def test_zero_after_wipeout(self) -> None:
+        assert compute_period_returns([100, 0.0, 0.0]) == [-1.0, 0.0]
+
+
 class TestScoreCard:
     def test_integration(self) -> None:
         # 5 weeks: start at 1M, end at 1.1M
@@ -106,3 +128,21 @@ class TestScoreCard:
         assert sc.cagr > 0
         assert sc.max_drawdown <= 0
         assert sc.annualized_volatility > 0
+
+    def test_matches_per_metric_functions(self) -> None:
+        values = [1_000_000, 1_040_000, 980_000, 1_010_000, 930_000, 1_120_000]
+        returns = [(b - a) / a for a, b in zip(values, values[1:])]
+        sc = compute_scorecard(values)
+        assert sc.max_drawdown == pytest.approx(compute_max_drawdown(values))
+        assert sc.annualized_volatility == pytest.approx(
+            compute_annualized_volatility(returns)
+        )
+        assert sc.sharpe_ratio == pytest.approx(compute_sharpe_ratio(returns))
+
+    def test_wiped_out_portfolio(self) -> None:
+        values = [1_000_000, 400_000, 0.0, 0.0, 0.0]
+        sc = compute_scorecard(values)
+        assert sc.final_value == 0.0
+        assert sc.max_drawdown == pytest.approx(-1.0)
+        assert sc.cagr == -1.0
+        assert math.isfinite(sc.sharpe_ratio)
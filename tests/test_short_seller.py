@@ -1,75 +1,163 @@
 """Tests for Short Seller agent."""
 
+import functools
 import random
 
 import pytest
 
 from wallstreet.agents.short_seller import ShortSellerAgent
 from wallstreet.models.enums import RateDirection, Regime, Sector, VolatilityState
-from wallstreet.models.game import GameConfig, GameState, WeekResult
-from wallstreet.models.market import MacroState, SectorReturns
-from wallstreet.models.narrative import ShortThesis
+from wallstreet.models.game import GameConfig, GameState
+from wallstreet.models.market import MacroState
 from wallstreet.models.portfolio import Allocation, Holdings, PortfolioState
 
 
-def _make_game_state(
-    macro: MacroState,
-    history: list[WeekResult] | None = None,
-) -> GameState:
+# Frozen models, validated once and shared by every game state built below
+_EVEN_HOLDINGS = Holdings(positions={s: 1_000_000.0 / len(Sector) for s in Sector})
+_CONFIG = GameConfig(seed=42, starting_cash=1_000_000.0, total_weeks=26)
+
+
+def _make_game_state(macro: MacroState) -> GameState:
     portfolio = PortfolioState(
         cash=0.0,
-        holdings=Holdings(positions={s: 200_000.0 for s in Sector}),
+        holdings=_EVEN_HOLDINGS,
         total_value=1_000_000.0,
         week=macro.week,
     )
     return GameState(
-        config=GameConfig(seed=42, starting_cash=1_000_000.0, total_weeks=26),
+        config=_CONFIG,
         macro_state=macro,
         portfolio=portfolio,
         weekly_values=[1_000_000.0],
-        history=history or [],
     )
 
 
-class TestShortSellerAgent:
-    def setup_method(self) -> None:
-        self.agent = ShortSellerAgent()
-        self.bull_macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.STABLE,
-            week=1,
-        )
-
-    def test_concentration_attack(self) -> None:
-        """Sector > 40% triggers concentration attack."""
-        alloc = Allocation(weights={
+@functools.lru_cache(maxsize=None)
+def _macro(
+    regime: Regime, rate_direction: RateDirection, week: int
+) -> MacroState:
+    # MacroState is frozen, so rows with the same macro share one instance
+    return MacroState(
+        regime=regime,
+        volatility_state=VolatilityState.NORMAL,
+        rate_direction=rate_direction,
+        week=week,
+    )
+
+
+# (macro, weights, expected target, minimum conviction) for the attacks
+# that must single out one sector
+_TARGETED_ATTACKS = [
+    pytest.param(
+        _macro(Regime.BULL, RateDirection.STABLE, 1),
+        {  # Sector > 40% triggers concentration attack
             Sector.TECH: 60.0, Sector.ENERGY: 8.0,
             Sector.FINANCIALS: 8.0, Sector.CONSUMER: 8.0,
             Sector.CONSUMER_DISC: 8.0, Sector.INDUSTRIALS: 4.0,
             Sector.HEALTHCARE: 4.0,
-        })
-        game = _make_game_state(self.bull_macro)
-        result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
-        assert result is not None
-        assert result.target_sector == Sector.TECH
-        assert result.conviction >= 0.60
+        },
+        Sector.TECH,
+        0.60,
+        id="concentration",
+    ),
+    pytest.param(
+        _macro(Regime.BEAR, RateDirection.STABLE, 5),
+        {  # Equal cyclical overweights resolve to the earlier sector
+            Sector.TECH: 30.0, Sector.ENERGY: 8.0,
+            Sector.FINANCIALS: 8.0, Sector.CONSUMER: 8.0,
+            Sector.CONSUMER_DISC: 8.0, Sector.INDUSTRIALS: 30.0,
+            Sector.HEALTHCARE: 8.0,
+        },
+        Sector.TECH,
+        0.0,
+        id="regime_misalignment_tie_picks_first_in_sector_order",
+    ),
+    pytest.param(
+        _macro(Regime.BULL, RateDirection.RISING, 3),
+        {  # Tech overweight with rising rates triggers attack
+            Sector.TECH: 35.0, Sector.ENERGY: 15.0,
+            Sector.FINANCIALS: 10.0, Sector.CONSUMER: 10.0,
+            Sector.CONSUMER_DISC: 10.0, Sector.INDUSTRIALS: 10.0,
+            Sector.HEALTHCARE: 10.0,
+        },
+        Sector.TECH,
+        0.0,
+        id="rate_sensitivity",
+    ),
+    pytest.param(
+        _macro(Regime.BULL, RateDirection.STABLE, 1),
+        {  # Player shorting a sector in bull market triggers squeeze attack
+            Sector.TECH: 30.0, Sector.ENERGY: 25.0,
+            Sector.FINANCIALS: 15.0, Sector.CONSUMER: 25.0,
+            Sector.CONSUMER_DISC: 5.0, Sector.INDUSTRIALS: -15.0,
+            Sector.HEALTHCARE: 15.0,
+        },
+        Sector.INDUSTRIALS,
+        0.0,
+        id="player_short_in_bull",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def agent() -> ShortSellerAgent:
+    # The agent keeps no state between analyze() calls
+    return ShortSellerAgent()
 
-    def test_no_attack_balanced(self) -> None:
+
+@pytest.fixture(scope="module")
+def bull_game(sample_macro_bull: MacroState) -> GameState:
+    # analyze() only reads the game state, so one is shared by the module
+    return _make_game_state(sample_macro_bull)
+
+
+@pytest.fixture(scope="module")
+def recession_game(sample_macro_recession: MacroState) -> GameState:
+    return _make_game_state(sample_macro_recession)
+
+
+class TestShortSellerAgent:
+    @pytest.mark.parametrize(
+        "macro,weights,target,min_conviction", _TARGETED_ATTACKS
+    )
+    def test_attack_targets_sector(
+        self,
+        agent: ShortSellerAgent,
+        seeded_rng: random.Random,
+        macro: MacroState,
+        weights: dict[Sector, float],
+        target: Sector,
+        min_conviction: float,
+    ) -> None:
+        alloc = Allocation(weights=weights)
+        game = _make_game_state(macro)
+        result = agent.analyze(alloc, macro, game, seeded_rng)
+        assert result is not None
+        assert result.target_sector == target
+        assert result.conviction >= min_conviction
+
+    def test_no_attack_balanced(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_bull: MacroState,
+        bull_game: GameState,
+        sample_allocation_balanced: Allocation,
+        seeded_rng: random.Random,
+    ) -> None:
         """Balanced allocation in bull market yields no attack."""
-        alloc = Allocation(weights={s: 100.0 / len(Sector) for s in Sector})
-        game = _make_game_state(self.bull_macro)
-        result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
+        alloc = sample_allocation_balanced
+        result = agent.analyze(alloc, sample_macro_bull, bull_game, seeded_rng)
         assert result is None
 
-    def test_regime_misalignment_attack(self) -> None:
+    def test_regime_misalignment_attack(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_recession: MacroState,
+        recession_game: GameState,
+        seeded_rng: random.Random,
+    ) -> None:
         """Cyclicals overweight in recession triggers attack."""
-        recession_macro = MacroState(
-            regime=Regime.RECESSION,
-            volatility_state=VolatilityState.HIGH,
-            rate_direction=RateDirection.FALLING,
-            week=5,
-        )
+        recession_macro = sample_macro_recession
         # Use weights below 40% to avoid concentration firing first,
         # but above 25% for at least one cyclical to trigger regime misalignment
         alloc = Allocation(weights={
@@ -78,85 +166,64 @@ class TestShortSellerAgent:
             Sector.CONSUMER_DISC: 14.0, Sector.INDUSTRIALS: 15.0,
             Sector.HEALTHCARE: 5.0,
         })
-        game = _make_game_state(recession_macro)
-        result = self.agent.analyze(alloc, recession_macro, game, random.Random(42))
+        result = agent.analyze(alloc, recession_macro, recession_game, seeded_rng)
         assert result is not None
         assert result.target_sector in {
             Sector.TECH, Sector.ENERGY, Sector.INDUSTRIALS, Sector.CONSUMER_DISC
         }
 
-    def test_rate_sensitivity_attack(self) -> None:
-        """Tech overweight with rising rates triggers attack."""
-        rising_macro = MacroState(
-            regime=Regime.BULL,
-            volatility_state=VolatilityState.NORMAL,
-            rate_direction=RateDirection.RISING,
-            week=3,
-        )
-        alloc = Allocation(weights={
-            Sector.TECH: 35.0, Sector.ENERGY: 15.0,
-            Sector.FINANCIALS: 10.0, Sector.CONSUMER: 10.0,
-            Sector.CONSUMER_DISC: 10.0, Sector.INDUSTRIALS: 10.0,
-            Sector.HEALTHCARE: 10.0,
-        })
-        game = _make_game_state(rising_macro)
-        result = self.agent.analyze(alloc, rising_macro, game, random.Random(42))
-        assert result is not None
-        assert result.target_sector == Sector.TECH
-
-    def test_conviction_bounds(self) -> None:
+    @pytest.mark.parametrize("tech_pct", [45, 60, 80, 100])
+    def test_conviction_bounds(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_bull: MacroState,
+        bull_game: GameState,
+        tech_pct: int,
+        seeded_rng: random.Random,
+    ) -> None:
         """Conviction is always 0-1."""
-        for tech_pct in [45, 60, 80, 100]:
-            remaining = 100 - tech_pct
-            per_other = remaining / 6
-            alloc = Allocation(weights={
-                Sector.TECH: float(tech_pct),
-                Sector.ENERGY: per_other,
-                Sector.FINANCIALS: per_other,
-                Sector.CONSUMER: per_other,
-                Sector.CONSUMER_DISC: per_other,
-                Sector.INDUSTRIALS: per_other,
-                Sector.HEALTHCARE: per_other,
-            })
-            game = _make_game_state(self.bull_macro)
-            result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
-            if result:
-                assert 0.0 <= result.conviction <= 1.0
-
-    def test_player_short_in_bull_attack(self) -> None:
-        """Player shorting a sector in bull market triggers squeeze attack."""
+        remaining = 100 - tech_pct
+        per_other = remaining / 6
         alloc = Allocation(weights={
-            Sector.TECH: 30.0, Sector.ENERGY: 25.0,
-            Sector.FINANCIALS: 15.0, Sector.CONSUMER: 25.0,
-            Sector.CONSUMER_DISC: 5.0, Sector.INDUSTRIALS: -15.0,
-            Sector.HEALTHCARE: 15.0,
+            Sector.TECH: float(tech_pct),
+            Sector.ENERGY: per_other,
+            Sector.FINANCIALS: per_other,
+            Sector.CONSUMER: per_other,
+            Sector.CONSUMER_DISC: per_other,
+            Sector.INDUSTRIALS: per_other,
+            Sector.HEALTHCARE: per_other,
         })
-        game = _make_game_state(self.bull_macro)
-        result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
-        assert result is not None
-        assert result.target_sector == Sector.INDUSTRIALS
-
-    def test_no_squeeze_attack_in_recession(self) -> None:
+        result = agent.analyze(alloc, sample_macro_bull, bull_game, seeded_rng)
+        if result:
+            assert 0.0 <= result.conviction <= 1.0
+
+    def test_no_squeeze_attack_in_recession(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_recession: MacroState,
+        recession_game: GameState,
+        seeded_rng: random.Random,
+    ) -> None:
         """Player shorts in recession should NOT trigger squeeze attack."""
-        recession_macro = MacroState(
-            regime=Regime.RECESSION,
-            volatility_state=VolatilityState.HIGH,
-            rate_direction=RateDirection.FALLING,
-            week=5,
-        )
+        recession_macro = sample_macro_recession
         alloc = Allocation(weights={
             Sector.TECH: 20.0, Sector.ENERGY: 15.0,
             Sector.FINANCIALS: 20.0, Sector.CONSUMER: 25.0,
             Sector.CONSUMER_DISC: 5.0, Sector.INDUSTRIALS: -10.0,
             Sector.HEALTHCARE: 25.0,
         })
-        game = _make_game_state(recession_macro)
-        result = self.agent.analyze(alloc, recession_macro, game, random.Random(42))
+        result = agent.analyze(alloc, recession_macro, recession_game, seeded_rng)
         # Should not be a squeeze attack (may be None or different attack type)
         if result is not None:
             assert "squeeze" not in result.critique.lower()
 
-    def test_concentration_on_large_short(self) -> None:
+    def test_concentration_on_large_short(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_bull: MacroState,
+        bull_game: GameState,
+        seeded_rng: random.Random,
+    ) -> None:
         """A large short position (|weight| > 40%) triggers concentration attack."""
         alloc = Allocation(weights={
             Sector.TECH: 80.0, Sector.ENERGY: 15.0,
@@ -164,13 +231,18 @@ class TestShortSellerAgent:
             Sector.CONSUMER_DISC: 10.0, Sector.INDUSTRIALS: -50.0,
             Sector.HEALTHCARE: 10.0,
         })
-        game = _make_game_state(self.bull_macro)
-        result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
+        result = agent.analyze(alloc, sample_macro_bull, bull_game, seeded_rng)
         assert result is not None
         # Should trigger concentration on either TECH (80%) or INDUSTRIALS (|-50|=50%)
         assert result.conviction >= 0.60
 
-    def test_critique_not_empty(self) -> None:
+    def test_critique_not_empty(
+        self,
+        agent: ShortSellerAgent,
+        sample_macro_bull: MacroState,
+        bull_game: GameState,
+        seeded_rng: random.Random,
+    ) -> None:
         """Critique is non-empty when attack fires."""
         alloc = Allocation(weights={
             Sector.TECH: 50.0, Sector.ENERGY: 8.0,
@@ -178,7 +250,6 @@ class TestShortSellerAgent:
             Sector.CONSUMER_DISC: 8.0, Sector.INDUSTRIALS: 8.0,
             Sector.HEALTHCARE: 8.0,
         })
-        game = _make_game_state(self.bull_macro)
-        result = self.agent.analyze(alloc, self.bull_macro, game, random.Random(42))
+        result = agent.analyze(alloc, sample_macro_bull, bull_game, seeded_rng)
         assert result is not None
         assert len(result.critique) > 0
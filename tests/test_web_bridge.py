@@ -0,0 +1,49 @@
+"""Tests for the WebSocket bridge between the game thread and the browser."""
+
+import asyncio
+import gc
+
+import pytest
+
+from wallstreet.web.server import WebSocketBridge
+
+
+class _DisconnectedSocket:
+    """Stands in for a WebSocket whose client has gone away."""
+
+    def __init__(self) -> None:
+        self.sends = 0
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sends += 1
+        raise ConnectionResetError("client went away")
+
+
+def test_send_failure_reaches_game_thread_without_task_error() -> None:
+    async def scenario() -> list[dict]:
+        loop = asyncio.get_running_loop()
+        loop_errors: list[dict] = []
+        loop.set_exception_handler(lambda _loop, context: loop_errors.append(context))
+
+        ws = _DisconnectedSocket()
+        bridge = WebSocketBridge(ws, loop)  # type: ignore[arg-type]
+        bridge.console.print("week 1")
+        bridge.flush_output()
+        await asyncio.wait_for(bridge.writer_task, timeout=1)
+
+        assert ws.sends == 1
+        assert isinstance(bridge.send_error, ConnectionResetError)
+        # The writer ends cleanly; the error travels through send_error
+        assert bridge.writer_task.exception() is None
+        # A game thread blocked in sync_input is woken up
+        assert bridge.input_queue.get_nowait() == ""
+        with pytest.raises(ConnectionResetError):
+            bridge.flush_output()
+        with pytest.raises(ConnectionResetError):
+            await bridge.close_output()
+
+        del bridge
+        gc.collect()
+        return loop_errors
+
+    assert asyncio.run(scenario()) == []